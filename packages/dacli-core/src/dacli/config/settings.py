@@ -155,6 +155,8 @@ class AgentSettings(BaseModel):
     log_level: str = "INFO"
     save_history: bool = True
     history_path: str = ".dacli/history/"
+    # Newest prompt inputs loaded for arrow-key recall / auto-suggest.
+    input_history_limit: int = Field(default=1000, ge=1)
     state_path: str = ".dacli/state/"
 
     @field_validator("log_level")
@@ -591,9 +593,17 @@ def load_config(config_path: str | None = None) -> Settings:
     return settings
 
 
+# libyaml's C emitter when PyYAML was built with it; the pure-Python SafeDumper
+# otherwise. Safe either way: model_dump(mode="json") leaves only plain types.
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
 def save_config(settings: Settings, config_path: str = "config.yaml") -> None:
-    # Save settings to YAML file
-    config_dict = settings.model_dump()
+    # Save settings to YAML file. None fields are omitted: every Optional field
+    # defaults to None, so a reload restores them unchanged.
+    config_dict = settings.model_dump(mode="json", exclude_none=True)
 
     with open(config_path, "w", encoding="utf-8") as f:
-        yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(
+            config_dict, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False
+        )
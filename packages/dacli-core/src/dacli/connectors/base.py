@@ -10,12 +10,15 @@ imports its result type from one place.
 """
 
 import contextlib
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from dacli.core.fastjson import dumps_bytes
+
 
 class ToolStatus(Enum):
     # Status of the tool execution. DENIED/BLOCKED are governance verdicts
@@ -25,24 +28,37 @@ class ToolStatus(Enum):
     DENIED, BLOCKED = "denied", "blocked"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolResult:
-    # Result of a connector operation
+    # Result of a connector operation. Frozen: results are built once and only
+    # read afterwards; annotate one with with_metadata().
     tool_name: str
     status: ToolStatus
     data: Any = None
     error: str | None = None
     execution_time_ms: float = 0.0
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Creation time as epoch ns: time.time_ns() allocates no datetime on the
+    # construction path; the datetime is built only when serialized.
+    timestamp_ns: int = field(default_factory=time.time_ns)
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def timestamp(self) -> datetime:
+        # Local-time creation timestamp (what datetime.now() used to store).
+        return datetime.fromtimestamp(self.timestamp_ns / 1_000_000_000)
+
+    def with_metadata(self, **extra: Any) -> "ToolResult":
+        """A copy with ``extra`` merged over this result's metadata."""
+        return replace(self, metadata={**(self.metadata or {}), **extra})
+
     @property
     def success(self) -> bool:
         # Check if the tool execution was successful
-        return self.status == ToolStatus.SUCCESS
+        return self.status is ToolStatus.SUCCESS
 
     def to_dict(self) -> dict[str, Any]:
-        # Convert the result to dictionary for serialization
+        # Convert the result to dictionary for serialization. Status is the
+        # enum *value*, so the dict is JSON-ready without a default= pass.
         return {
             "tool_name": self.tool_name,
             "status": self.status.value,
@@ -53,30 +69,39 @@ class ToolResult:
             "metadata": self.metadata
         }
 
+    def to_json_bytes(self) -> bytes:
+        # UTF-8 JSON of to_dict() (orjson when installed); tool data that is not
+        # natively serializable (Decimal, date, …) falls back to str.
+        return dumps_bytes(self.to_dict(), default=str)
+
     def to_message(self) -> str:
         # Convert the result to a message string for LLM context.
         # Tools with metadata["context_summary"] get a compact one-liner.
-        if self.success:
-            meta = self.metadata if isinstance(self.metadata, dict) else {}
-            summary = meta.get("context_summary")
-            if summary:
-                return f"[{self.tool_name}] {summary}"
-            if isinstance(self.data, list):
-                if len(self.data) == 0:
-                    return f"[{self.tool_name}] Executed successfully. No results returned"
-                return f"[{self.tool_name}] Executed successfully. Returned {len(self.data)} rows:\n{self._format_data()}"
-            if self.data:
-                return f"[{self.tool_name}] Executed successfully:\n{self._format_data()}"
-            return f"[{self.tool_name}] Executed successfully."
-        return f"[{self.tool_name}] failed with error: {self.error}"
-
-    def _format_data(self) -> str:
-        # Format data for the LLM context. Data work: send the FULL result set —
-        # no row cap — so the model never has to guess or summarize ("... N more
-        # rows"). The CLI renders the same data as a table for the human.
-        if isinstance(self.data, list) and len(self.data) > 0 and isinstance(self.data[0], dict):
-            return "\n".join(f" Row {i+1}: {row}" for i, row in enumerate(self.data))
-        return str(self.data)
+        name = self.tool_name
+        if self.status is not ToolStatus.SUCCESS:
+            return f"[{name}] failed with error: {self.error}"
+        meta = self.metadata
+        summary = meta.get("context_summary") if isinstance(meta, dict) else None
+        if summary:
+            return f"[{name}] {summary}"
+        data = self.data
+        if isinstance(data, list):
+            if not data:
+                return f"[{name}] Executed successfully. No results returned"
+            return f"[{name}] Executed successfully. Returned {len(data)} rows:\n{self._format_rows(data)}"
+        if data:
+            return f"[{name}] Executed successfully:\n{data}"
+        return f"[{name}] Executed successfully."
+
+    @staticmethod
+    def _format_rows(rows: list) -> str:
+        # Format a non-empty row list for the LLM context. Data work: send the
+        # FULL result set — no row cap — so the model never has to guess or
+        # summarize ("... N more rows"). The CLI renders the same data as a
+        # table for the human.
+        if isinstance(rows[0], dict):
+            return "\n".join([f" Row {i}: {row}" for i, row in enumerate(rows, 1)])
+        return str(rows)
 
 
 class Risk(str, Enum):
@@ -114,17 +139,27 @@ class OperationSpec:
     # The connector registry enforces "at least one" when ``enforce_postconditions``
     # is on — fluent success is not proof the intended state change is correct.
     postconditions: list[Any] = field(default_factory=list)
+    # Rendered tool definition, memoized by to_tool_definition().
+    _tool_definition: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_tool_definition(self) -> dict[str, Any]:
-        """Render as an OpenAI-style function tool definition."""
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.parameters,
-            },
-        }
+        """Render as an OpenAI-style function tool definition.
+
+        The spec is immutable in practice, so the dict is built once and shared;
+        callers treat it as read-only.
+        """
+        if self._tool_definition is None:
+            self._tool_definition = {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": self.parameters,
+                },
+            }
+        return self._tool_definition
 
 
 class Connector(ABC):
@@ -163,6 +198,7 @@ class Connector(ABC):
 
     @is_connected.setter
     def is_connected(self, value: bool):
+        # Kept for third-party connectors; built-ins write _is_connected directly.
         self._is_connected = value
 
     @abstractmethod
@@ -193,9 +229,9 @@ class Connector(ABC):
     async def connect(self) -> bool:
         """Establish a connection if needed. Default: mark healthy via health()."""
         result = await self.health()
-        self.is_connected = result.success
-        return self.is_connected
+        self._is_connected = result.success
+        return self._is_connected
 
     async def disconnect(self) -> None:
         """Clean up connection resources."""
-        self.is_connected = False
+        self._is_connected = False
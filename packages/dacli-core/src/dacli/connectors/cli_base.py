@@ -159,8 +159,8 @@ class CliConnector(Connector):
     # Lifecycle — a CLI connector is "connected" when its binary is reachable.
     # ------------------------------------------------------------------
     async def connect(self) -> bool:
-        self.is_connected = self._binary_available()
-        return self.is_connected
+        self._is_connected = self._binary_available()
+        return self._is_connected
 
     async def health(self) -> ToolResult:
         started = time.time()
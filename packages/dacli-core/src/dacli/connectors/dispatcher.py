@@ -163,7 +163,7 @@ class Dispatcher:
             if staged:
                 # Tag so the UI can mark the call [TEST]; the connector name lets
                 # downstream surfaces attribute the staged result.
-                result.metadata = {**(result.metadata or {}), "test_mode": connector.name}
+                result = result.with_metadata(test_mode=connector.name)
 
             # Record the execution outcome + post-condition verdict in the audit
             # ledger so the decision is reconstructable end to end.
@@ -173,10 +173,7 @@ class Dispatcher:
                 # rail by outcome. Presentation-only; never breaks the loop.
                 try:
                     tier = decision.classification.tier
-                    result.metadata = {
-                        **(result.metadata or {}),
-                        "tier": getattr(tier, "value", str(tier)),
-                    }
+                    result = result.with_metadata(tier=getattr(tier, "value", str(tier)))
                 except Exception:
                     log.debug("tier tag failed", exc_info=True)
 
@@ -261,7 +258,7 @@ class Dispatcher:
         )
         report = await self._verifier.verify(postconditions, ctx, label=tool_name)
         # Record the verdict on the result for audit/UI regardless of outcome.
-        result.metadata = {**(result.metadata or {}), "verification": report.to_dict()}
+        result = result.with_metadata(verification=report.to_dict())
 
         if not report.passed and getattr(self._verifier, "enforce", True):
             # A failed post-condition is not an accepted result. Downgrade so the
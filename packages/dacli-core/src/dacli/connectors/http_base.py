@@ -4,8 +4,10 @@ Some platforms are reached over an HTTP control plane rather than a CLI — an
 orchestrator's REST API (Airflow) or GraphQL endpoint (Dagster). This base gives
 those connectors the same testability the CLI base gives the shell ones: an
 **injectable transport** so golden tests drive the connector with canned HTTP
-responses and never touch the network. The live path lazily builds an httpx
-client.
+responses and never touch the network. The live path lazily builds one httpx
+client per connector and reuses it (keep-alive pool) until :meth:`disconnect`.
+That client belongs to the event loop it was built on: CLI commands each call
+``asyncio.run``, so a connector used across commands rebuilds it per loop.
 
 A subclass sets the base URL + auth headers, implements ``operations`` and
 ``invoke``, and calls :meth:`_request`.
@@ -13,6 +15,7 @@ A subclass sets the base URL + auth headers, implements ``operations`` and
 
 from __future__ import annotations
 
+import asyncio
 import time
 from dataclasses import dataclass, field
 from typing import Any
@@ -42,6 +45,8 @@ class HttpConnector(Connector):
     def __init__(self, settings: Any, transport: Transport | None = None):
         super().__init__(settings)
         self._transport = transport
+        self._client: Any = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
 
     # ------------------------------------------------------------------
     # Subclass hooks
@@ -73,11 +78,8 @@ class HttpConnector(Connector):
                 outcome = await outcome
             return outcome
 
-        import httpx
-
         url = self._base_url().rstrip("/") + path
-        async with httpx.AsyncClient(timeout=self._timeout()) as client:
-            resp = await client.request(method, url, params=params, json=json, headers=headers)
+        resp = await self._http().request(method, url, params=params, json=json, headers=headers)
         data = None
         try:
             data = resp.json()
@@ -85,6 +87,19 @@ class HttpConnector(Connector):
             data = None
         return HttpResult(resp.status_code, data, resp.text, dict(resp.headers))
 
+    def _http(self):
+        # One client per connector: a fresh AsyncClient per call paid a new
+        # connection pool (TCP + TLS handshake) on every request. Its sockets are
+        # tied to the loop that opened them; a client from an earlier (now closed)
+        # loop cannot be used or closed, so it is dropped and a new one built.
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            import httpx
+
+            self._client = httpx.AsyncClient(timeout=self._timeout())
+            self._client_loop = loop
+        return self._client
+
     def _reachable(self) -> bool:
         return self._transport is not None or bool(self._base_url())
 
@@ -113,11 +128,17 @@ class HttpConnector(Connector):
 
     # ------------------------------------------------------------------
     async def connect(self) -> bool:
-        self.is_connected = self._reachable()
-        return self.is_connected
+        self._is_connected = self._reachable()
+        return self._is_connected
 
     async def health(self) -> ToolResult:
         started = time.time()
         if not self._reachable():
             return self._fail("health", f"{self.name} has no base URL configured.", started)
         return self._ok("health", {"base_url": self._base_url(), "reachable": True}, started)
+
+    async def disconnect(self) -> None:
+        client, self._client = self._client, None
+        if client is not None and self._client_loop is asyncio.get_running_loop():
+            await client.aclose()
+        await super().disconnect()
@@ -185,6 +185,7 @@ class ConnectorRegistry:
             self._builtin_ids.add(connector.name)
 
     def _build_index(self) -> None:
+        self._order: tuple[str, ...] = self._compute_order()
         self._op_index = {}
         for connector_id, connector in self._connectors.items():
             for spec in connector.operations():
@@ -336,13 +337,17 @@ class ConnectorRegistry:
                 return spec
         return None
 
-    def _ordered_ids(self) -> list[str]:
+    def _ordered_ids(self) -> tuple[str, ...]:
+        # Read on every turn (tool definitions, digest) and every toolbar redraw
+        # (enabled connectors), so it is precomputed alongside the op index.
+        return self._order
+
+    def _compute_order(self) -> tuple[str, ...]:
         # Discovered connectors first (sorted for determinism), built-ins last.
         discovered = sorted(
             cid for cid in self._connectors if cid not in self._builtin_ids
         )
-        builtins = sorted(self._builtin_ids)
-        return discovered + builtins
+        return (*discovered, *sorted(self._builtin_ids))
 
     # ------------------------------------------------------------------
     # Lifecycle helpers
@@ -53,6 +53,8 @@ class SystemConnector(Connector):
         self._secrets: Any = None
         # Always ready; no external connection.
         self._is_connected = True
+        # Operation specs are static; built on first use (see operations()).
+        self._operations: list[OperationSpec] | None = None
 
     def bind_registry(self, registry: Any) -> None:
         """Late-bind the registry (progressive disclosure)."""
@@ -82,6 +84,13 @@ class SystemConnector(Connector):
     # Connector contract
     # ------------------------------------------------------------------
     def operations(self) -> list[OperationSpec]:
+        # The registry asks for these on every turn and every dispatch; build
+        # the specs once so each keeps its memoized tool definition.
+        if self._operations is None:
+            self._operations = self._build_operations()
+        return list(self._operations)
+
+    def _build_operations(self) -> list[OperationSpec]:
         return [
             OperationSpec(
                 name="request_user_input",
@@ -24,6 +24,7 @@ import logging
 import os
 import subprocess
 import sys
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -299,6 +300,10 @@ class ExtensionRegistry:
     def extension_ids(self) -> list[str]:
         return list(self._extensions)
 
+    def tool_counts(self) -> dict[str, int]:
+        """Registered tools per extension id, counted in one pass."""
+        return dict(Counter(t.extension for t in self._tools.values()))
+
     def failed_extensions(self) -> dict[str, str]:
         """Extensions that failed to load, mapped to why they were skipped — so a
         bad (e.g. freshly generated) extension is visible, not silently gone."""
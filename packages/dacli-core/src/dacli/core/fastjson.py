@@ -9,11 +9,17 @@ keeps working. The one wrinkle callers must respect — ``orjson.dumps`` returns
 * :func:`dumps` — a ``str`` (decoded), drop-in for ``json.dumps(obj, default=…)``.
 * :func:`dumps_bytes` — the raw ``bytes``, for an atomic byte writer.
 
-Only ``default`` is supported (the lone ``json.dumps`` kwarg the spill paths
-use); orjson takes it as a callable just like json, so ``default=str`` works in
-both backends. Other formatting kwargs (``indent``, ``sort_keys``) are
-deliberately unsupported here — full-file state writers that need them keep using
-:func:`dacli.core.atomicio.write_json_atomic` (stdlib json).
+Only ``default`` and a boolean ``indent`` (two-space, the one layout the
+session-state writers use) are supported; orjson takes ``default`` as a callable
+just like json, so ``default=str`` works in both backends. Other formatting
+kwargs (``sort_keys``, custom indent widths) are deliberately unsupported —
+writers that need them keep using :func:`dacli.core.atomicio.write_json_atomic`
+(stdlib json). :func:`loads` reads either ``bytes`` or ``str``.
+
+orjson also caps integers at 64 bits (Snowflake ``NUMBER(38,0)`` comes back as a
+Python int): it refuses to encode wider ones without consulting ``default``, and
+decodes them as lossy floats. Both directions fall back to stdlib json for such
+payloads, which keeps them exact.
 """
 
 from __future__ import annotations
@@ -30,17 +36,42 @@ except ImportError:  # pragma: no cover - exercised only on a bare install
     HAVE_ORJSON = False
 
 import json
+import re
+
+# orjson reads integers in [-2**63, 2**64) exactly and anything past that as a
+# float. Only a number with 19+ digits can fall outside (19 digits already reach
+# below -2**63), so documents containing one (rare) are decoded by stdlib json.
+_WIDE_DIGITS = re.compile(r"-?\d{19,}")
+_WIDE_DIGITS_B = re.compile(rb"-?\d{19,}")
 
 
-def dumps_bytes(obj: Any, *, default: Callable[[Any], Any] | None = None) -> bytes:
+def dumps_bytes(
+    obj: Any, *, default: Callable[[Any], Any] | None = None, indent: bool = False
+) -> bytes:
     """Serialize *obj* to UTF-8 JSON ``bytes`` (orjson when available)."""
     if orjson is not None:
-        return orjson.dumps(obj, default=default)
-    return json.dumps(obj, default=default).encode("utf-8")
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except orjson.JSONEncodeError:
+            # An int past 64 bits, say; stdlib json writes it (or raises the real error).
+            return json.dumps(obj, default=default, indent=2 if indent else None).encode("utf-8")
+    return json.dumps(obj, default=default, indent=2 if indent else None).encode("utf-8")
 
 
-def dumps(obj: Any, *, default: Callable[[Any], Any] | None = None) -> str:
+def dumps(
+    obj: Any, *, default: Callable[[Any], Any] | None = None, indent: bool = False
+) -> str:
     """Serialize *obj* to a JSON ``str`` (orjson when available, decoded)."""
     if orjson is not None:
-        return orjson.dumps(obj, default=default).decode("utf-8")
-    return json.dumps(obj, default=default)
+        return dumps_bytes(obj, default=default, indent=indent).decode("utf-8")
+    return json.dumps(obj, default=default, indent=2 if indent else None)
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from ``bytes`` or ``str`` (orjson when available)."""
+    if orjson is not None:
+        wide = _WIDE_DIGITS_B if isinstance(data, bytes) else _WIDE_DIGITS
+        if wide.search(data) is None:
+            return orjson.loads(data)
+    return json.loads(data)
@@ -353,26 +353,37 @@ class DacliHost:
             return display, False, str(e)
         return display, True, None
 
-    async def initialize(self) -> bool:
-        self._emit_status("Initializing agent...")
-        successfully_initialized: list[str] = []
-        failed_initializations: list[str] = []
-
+    async def _init_llm(self) -> str | None:
+        """Initialize the LLM client; return the error text, or None on success."""
         try:
             self._emit_status("Connecting to LLM provider ...")
             await self.llm.initialize()
-            successfully_initialized.append("LLM")
         except Exception as e:
-            self._emit_status(f"Failed to initialize LLM: {e!s}")
-            failed_initializations.append("LLM")
+            return str(e)
+        return None
+
+    async def initialize(self) -> bool:
+        self._emit_status("Initializing agent...")
+        successfully_initialized: list[str] = []
+        failed_initializations: list[str] = []
 
         catalog = self.registry.get_catalog()
         enabled = self.registry.enabled_connectors()
         enabled_ids = {c.name for c in enabled}
 
-        results = await asyncio.gather(
-            *(self._connect_one(c, catalog) for c in enabled), return_exceptions=True
+        # The LLM handshake and every connector connect are independent network
+        # round-trips, so boot time is the slowest one rather than their sum.
+        llm_error, *results = await asyncio.gather(
+            self._init_llm(),
+            *(self._connect_one(c, catalog) for c in enabled),
+            return_exceptions=True,
         )
+        if llm_error is None:
+            successfully_initialized.append("LLM")
+        else:
+            self._emit_status(f"Failed to initialize LLM: {llm_error!s}")
+            failed_initializations.append("LLM")
+
         for connector, outcome in zip(enabled, results, strict=True):
             if isinstance(outcome, BaseException):  # defensive; _connect_one catches
                 display = catalog.get(connector.name, {}).get("name", connector.name)
@@ -385,7 +385,7 @@ class Kernel:
                         disclosed.add(disclose_id)
 
                     # Check if user input is needed
-                    if result.status == ToolStatus.PENDING_APPROVAL:
+                    if result.status is ToolStatus.PENDING_APPROVAL:
                         needs_user_input = True
                         break
 
@@ -16,14 +16,16 @@ write catalog entries (the SQL parsing that decides *what* to record now lives i
 the connector, driven by structured results — never regex on the dispatch path).
 """
 
-import json
+import os
 
+from collections import OrderedDict
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from dacli.core.atomicio import write_json_atomic
+from dacli.core.atomicio import write_bytes_atomic
+from dacli.core.fastjson import dumps as _json_dumps, dumps_bytes as _json_dumps_bytes, loads as _json_loads
 from dacli.core.logging_setup import get_logger
 from dacli.core.timeutils import now_iso
 from dacli.memory.store import MemoryStore, MemoryEntry
@@ -36,6 +38,42 @@ from dacli.memory.procedural import ProceduralMemory
 from dacli.memory.retrieval import retrieve
 
 
+# Parsed session summaries keyed by state-file path, valid while the file's
+# (mtime_ns, size) is unchanged. State files carry the whole tool history, so
+# re-listing sessions re-parses only the ones written since the last listing.
+# An LRU capped at _SUMMARY_CACHE_SIZE paths, so a long-lived process does not
+# keep one entry per session file it has ever listed.
+_SUMMARY_CACHE_SIZE = 256
+_SUMMARY_CACHE: "OrderedDict[str, tuple[tuple[int, int], dict[str, Any]]]" = OrderedDict()
+
+
+def _session_summary(state_file: Path, st: os.stat_result) -> dict[str, Any] | None:
+    key = str(state_file)
+    stamp = (st.st_mtime_ns, st.st_size)
+    hit = _SUMMARY_CACHE.get(key)
+    if hit is not None and hit[0] == stamp:
+        _SUMMARY_CACHE.move_to_end(key)
+        return dict(hit[1])
+    try:
+        data = _json_loads(state_file.read_bytes())
+        todos = data.get("todos", []) or []
+        active = next((t.get("content") for t in todos if t.get("status") == "in_progress"), None)
+        summary = {
+            "session_id": data.get("session_id"),
+            "created_at": data.get("created_at"),
+            "updated_at": data.get("updated_at"),
+            "active_task": active,
+            "errors_count": data.get("errors_count", 0),
+        }
+    except Exception:
+        return None
+    _SUMMARY_CACHE[key] = (stamp, summary)
+    _SUMMARY_CACHE.move_to_end(key)
+    while len(_SUMMARY_CACHE) > _SUMMARY_CACHE_SIZE:
+        _SUMMARY_CACHE.popitem(last=False)
+    return dict(summary)
+
+
 @dataclass
 class ToolExecution:
     # Record of a tool execution
@@ -183,6 +221,11 @@ class AgentMemory:
         # Get all messages in the conversation
         return self._messages.copy()
 
+    def get_recent_messages(self, n: int) -> list[Message]:
+        # The last ``n`` messages — copies only the tail, so /history stays
+        # cheap however long the session runs.
+        return self._messages[-n:] if n > 0 else []
+
     def clear_messages(self) -> None:
         # Clear all messages (new conversation)
         self._messages = []
@@ -356,35 +399,38 @@ class AgentMemory:
         state_data = asdict(self.state)
         state_data["tool_history"] = [asdict(t) for t in self._tool_history]
 
-        write_json_atomic(state_file, state_data, indent=2, default=str)
+        write_bytes_atomic(state_file, _json_dumps_bytes(state_data, default=str, indent=True))
 
     def _save_history(self) -> None:
         # Save the conversation history to a file
         history_file = self._get_history_file()
         history_data = [asdict(m) for m in self._messages]
 
-        write_json_atomic(history_file, history_data, indent=2)
+        write_bytes_atomic(history_file, _json_dumps_bytes(history_data, indent=True))
 
-    def list_sessions(self) -> list[dict[str, Any]]:
-        """List all available sessions."""
-        sessions = []
+    def list_sessions(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """List available sessions, most recently updated first.
 
+        With ``limit``, only the ``limit`` most recently written state files are
+        considered (file mtime tracks ``updated_at``: every save rewrites the
+        file). Summaries of files unchanged since the last listing come from a
+        per-process cache instead of being re-parsed.
+        """
+        stamped = []
         for state_file in self.state_path.glob("state_*.json"):
             try:
-                with open(state_file, encoding="utf-8") as f:
-                    data = json.load(f)
-
-                todos = data.get("todos", []) or []
-                active = next((t.get("content") for t in todos if t.get("status") == "in_progress"), None)
-                sessions.append({
-                    "session_id": data.get("session_id"),
-                    "created_at": data.get("created_at"),
-                    "updated_at": data.get("updated_at"),
-                    "active_task": active,
-                    "errors_count": data.get("errors_count", 0),
-                })
-            except Exception:
+                stamped.append((state_file.stat(), state_file))
+            except OSError:
                 continue
+        if limit is not None:
+            stamped.sort(key=lambda e: e[0].st_mtime_ns, reverse=True)
+            stamped = stamped[:limit]
+
+        sessions = [
+            summary
+            for st, state_file in stamped
+            if (summary := _session_summary(state_file, st)) is not None
+        ]
 
         # Sort by updated_at descending
         sessions.sort(key=lambda x: x.get("updated_at", ""), reverse=True)
@@ -408,8 +454,7 @@ class AgentMemory:
 
         try:
             # Load state
-            with open(state_file, encoding="utf-8") as f:
-                state_data = json.load(f)
+            state_data = _json_loads(state_file.read_bytes())
 
             # Extract tool history
             tool_history = state_data.pop("tool_history", [])
@@ -426,8 +471,7 @@ class AgentMemory:
 
             # Load history if exists
             if history_file.exists():
-                with open(history_file, encoding="utf-8") as f:
-                    history_data = json.load(f)
+                history_data = _json_loads(history_file.read_bytes())
                 self._messages = [Message(**m) for m in history_data]
 
             return True
@@ -472,4 +516,4 @@ class AgentMemory:
         # Export current state as JSON string (session metadata + catalog snapshot)
         payload = asdict(self.state)
         payload["catalog"] = [e.to_record() for e in self.catalog.list_objects()]
-        return json.dumps(payload, indent=2, default=str)
+        return _json_dumps(payload, default=str, indent=True)
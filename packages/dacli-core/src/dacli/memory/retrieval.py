@@ -19,6 +19,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from collections.abc import Callable, Sequence
 
 from dacli.memory.store import MemoryEntry
@@ -34,8 +35,11 @@ MAX_STALENESS_PENALTY = 0.9
 _TOKEN_RE = re.compile(r"[A-Za-z0-9_]+")
 
 
-def _tokens(text: str) -> set:
-    return {t.lower() for t in _TOKEN_RE.findall(text or "")}
+# Keyed by the text itself: every rank() re-scores every entry against the new
+# query, so an entry's content is tokenized once instead of once per retrieval.
+@lru_cache(maxsize=4096)
+def _tokens(text: str) -> frozenset[str]:
+    return frozenset(t.lower() for t in _TOKEN_RE.findall(text))
 
 
 def lexical_relevance(query: str, entry: MemoryEntry) -> float:
@@ -44,11 +48,11 @@ def lexical_relevance(query: str, entry: MemoryEntry) -> float:
     A lightweight stand-in for semantic similarity. Scope values are folded into
     the searchable text so "BRONZE.CRM" matches an entry scoped to that object.
     """
-    q = _tokens(query)
+    q = _tokens(query or "")
     if not q:
         return 0.0
     scope_text = " ".join(str(v) for v in entry.scope.values())
-    doc = _tokens(entry.content) | _tokens(scope_text) | {t.lower() for t in entry.tags}
+    doc = _tokens(entry.content or "") | _tokens(scope_text) | {t.lower() for t in entry.tags}
     if not doc:
         return 0.0
     overlap = len(q & doc)
@@ -1,3 +1,4 @@
+import functools
 from pathlib import Path
 from collections.abc import Iterable
 
@@ -28,6 +29,15 @@ def _read(path: Path) -> str:
         return ""
 
 
+@functools.cache
+def _read_packaged(path: Path) -> str:
+    # The packaged core + connector fragments ship read-only in the wheel, and
+    # the context pipeline recomposes the prompt on every LLM iteration — read
+    # each one from disk once per process. User-owned files (SYSTEM.md,
+    # AGENTS.md) still go through _read so edits show up mid-session.
+    return _read(path)
+
+
 def compose_system_prompt(
     task: str = "",
     disclosed_connectors: Iterable[str] | None = None,
@@ -47,10 +57,10 @@ def compose_system_prompt(
     task-conditioned fragments; unused today.
     """
     override = system_md_override()
-    parts = [_read(override) if override else _read(CORE_FRAGMENT)]
+    parts = [_read(override) if override else _read_packaged(CORE_FRAGMENT)]
     parts.extend(_read(agents) for agents in agents_md_chain())
     for connector_id in disclosed_connectors or []:
-        fragment = _read(FRAGMENTS_DIR / f"{connector_id}.md")
+        fragment = _read_packaged(FRAGMENTS_DIR / f"{connector_id}.md")
         if fragment:
             parts.append(fragment)
     return "\n\n".join(p for p in parts if p)
@@ -7,12 +7,13 @@ to the agent. Extracted from ``scripts/cli.py`` so the Click surface stays thin.
 
 from __future__ import annotations
 
-import asyncio
+import os
+from collections.abc import Iterable
 from pathlib import Path
 
 from prompt_toolkit import PromptSession
 from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
-from prompt_toolkit.history import FileHistory
+from prompt_toolkit.history import FileHistory, ThreadedHistory
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 
@@ -37,6 +38,52 @@ from dacli.tui import DacliUI
 log = get_logger(__name__)
 
 
+class _BoundedFileHistory(FileHistory):
+    """``FileHistory`` that loads only the newest ``max_entries`` inputs.
+
+    The stock loader parses the whole append-only file; after months of use
+    that is MBs read before the first arrow-key recall. This one reads
+    backwards from the end in blocks until it holds enough entries. Writes are
+    unchanged, so the file stays compatible with plain ``FileHistory``.
+    """
+
+    _BLOCK = 64 * 1024
+
+    def __init__(self, filename: str, max_entries: int) -> None:
+        super().__init__(filename)
+        self.max_entries = max_entries
+
+    def load_history_strings(self) -> Iterable[str]:
+        if not os.path.exists(self.filename):
+            return []
+        with open(self.filename, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            tail = b""
+            # Every entry starts with a "\n# <timestamp>" header line; content
+            # lines start with "+", so the header count is the entry count.
+            while pos > 0 and tail.count(b"\n#") <= self.max_entries:
+                step = min(self._BLOCK, pos)
+                pos -= step
+                f.seek(pos)
+                tail = f.read(step) + tail
+        if pos > 0:
+            # Drop the partial entry cut by the block boundary.
+            tail = tail[tail.find(b"\n#"):]
+        strings: list[str] = []
+        lines: list[str] = []
+        for raw in tail.splitlines(keepends=True):
+            line = raw.decode("utf-8", errors="replace")
+            if line.startswith("+"):
+                lines.append(line[1:])
+            elif lines:
+                strings.append("".join(lines)[:-1])
+                lines = []
+        if lines:
+            strings.append("".join(lines)[:-1])
+        # Newest first, as prompt_toolkit expects.
+        return list(reversed(strings[-self.max_entries:]))
+
+
 def _enabled_connector_names(registry, ext_registry=None) -> list:
     # Short connector names for the welcome card / status bar.
     # Old-path connectors (system/sandbox — internal, skip them in display).
@@ -286,7 +333,13 @@ async def run_chat(
         )
 
     pt_session = PromptSession(
-        history=FileHistory(str(history_file)),
+        # Bounded, and loaded on a worker thread so a long history file never
+        # delays the first prompt.
+        history=ThreadedHistory(
+            _BoundedFileHistory(
+                str(history_file), settings.agent.input_history_limit
+            )
+        ),
         auto_suggest=AutoSuggestFromHistory(),
         completer=slash.SlashCommandCompleter(CLI_COMMANDS),
         complete_while_typing=True,
@@ -297,10 +350,10 @@ async def run_chat(
     try:
         while True:
             try:
-                user_input = await asyncio.to_thread(
-                    pt_session.prompt,
-                    chat_ui.prompt_html(),
-                )
+                # Native coroutine prompt: no worker-thread hop per line, and
+                # Ctrl-C / Ctrl-D surface here as KeyboardInterrupt / EOFError
+                # on the loop's own thread.
+                user_input = await pt_session.prompt_async(chat_ui.prompt_html())
 
                 if not user_input.strip():
                     continue
@@ -331,16 +384,9 @@ async def run_chat(
                     chat_ui.notice("Interrupted.", style="warning")
                     continue
 
-                if response.error:
-                    chat_ui.error(f"Error: {response.error}")
-
-                if response.needs_user_input:
-                    chat_ui.notice(
-                        "⏳ Agent is waiting for your input to continue.",
-                        style="warning",
-                    )
-
-                con.print()
+                chat_ui.turn_end(
+                    error=response.error, needs_input=response.needs_user_input
+                )
 
             except KeyboardInterrupt:
                 chat_ui.stream.abort()
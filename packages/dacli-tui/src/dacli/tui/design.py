@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 
 from rich import box
@@ -62,6 +63,26 @@ class Glyphs:
     # Box style for panels/tables.
     box: box.Box
 
+    @cached_property
+    def notice_icons(self) -> dict[str, str]:
+        """Notice style → leading icon, built once per glyph set."""
+        return {
+            "success": self.ok,
+            "warning": self.warn,
+            "error": self.err,
+            "bad": self.err,
+            "info": self.info,
+        }
+
+    @cached_property
+    def todo_icons(self) -> dict[str, str]:
+        """Todo status → icon for the ``/status`` task table."""
+        return {
+            "pending": self.pending,
+            "in_progress": self.running,
+            "completed": self.ok,
+        }
+
 
 UNICODE = Glyphs(
     agent="⏺", tool="⏺", result="⎿", user_caret="❯",
@@ -439,15 +439,12 @@ class PanelsMixin:
 
         # New-path extensions (seeds + user-generated)
         if ext_registry is not None:
+            tool_counts = ext_registry.tool_counts()
             for ext_id in ext_registry.extension_ids():
-                # Count tools belonging to this extension
-                tool_count = sum(
-                    1 for t in ext_registry._tools.values() if t.extension == ext_id
-                )
                 table.add_row(
                     ext_id,
                     f"[ok]{self.glyphs.enabled} loaded[/ok]",
-                    str(tool_count),
+                    str(tool_counts.get(ext_id, 0)),
                 )
                 shown = True
             for ext_id, reason in ext_registry.failed_extensions().items():
@@ -918,17 +915,20 @@ class PanelsMixin:
 
     def status_panel(self, memory) -> None:
         # Render the current agent status: session panel, plan and statistics.
+        # Everything is composed into one Group and printed once — a single
+        # render + terminal write instead of one per section.
         summary = memory.get_progress_summary()
 
         # Main status panel
-        status_text = Text()
-        status_text.append("Session     ", style="muted")
-        status_text.append(f"{summary['session_id']}\n", style="accent")
-        status_text.append("Active task ", style="muted")
-        status_text.append(
-            f"{summary.get('active_task') or self.glyphs.dash}", style="phase"
-        )
-        self.console.print(
+        # Assembled in one call; the task text is user data, so it is never
+        # routed through the markup parser.
+        status_text = Text.assemble(
+            ("Session     ", "muted"),
+            (f"{summary['session_id']}\n", "accent"),
+            ("Active task ", "muted"),
+            (f"{summary.get('active_task') or self.glyphs.dash}", "phase"),
+        )
+        parts: list[RenderableType] = [
             Panel(
                 status_text,
                 title="[accent]Status[/accent]",
@@ -936,7 +936,7 @@ class PanelsMixin:
                 border_style="border",
                 padding=SPACING["panel_pad"],
             )
-        )
+        ]
 
         # Plan (todo list)
         if summary.get("todos"):
@@ -951,17 +951,14 @@ class PanelsMixin:
             table.add_column("#", style="muted", justify="right")
             table.add_column("Status")
             table.add_column("Task", style="info")
+            icons = self.glyphs.todo_icons
             for i, todo in enumerate(summary.get("todos", []), 1):
                 status = todo.get("status", "pending")
-                status_icon = {
-                    "pending": self.glyphs.pending,
-                    "in_progress": self.glyphs.running,
-                    "completed": self.glyphs.ok,
-                }.get(status, self.glyphs.pending)
+                status_icon = icons.get(status, self.glyphs.pending)
                 table.add_row(
                     str(i), f"{status_icon} {status}", todo.get("content", "")
                 )
-            self.console.print(table)
+            parts.append(table)
 
         # Stats
         stats_table = Table(show_header=False, box=None, padding=(0, 2, 0, 0))
@@ -973,7 +970,7 @@ class PanelsMixin:
         stats_table.add_row("Total rows", str(summary.get("total_rows_loaded", 0)))
         stats_table.add_row("Files discovered", str(summary.get("files_discovered", 0)))
         stats_table.add_row("Errors", str(summary.get("errors_count", 0)))
-        self.console.print(
+        parts.append(
             Panel(
                 stats_table,
                 title="[accent]Statistics[/accent]",
@@ -984,7 +981,11 @@ class PanelsMixin:
         )
 
         if summary.get("last_error"):
-            self.console.print(f"[error]Last error:[/error] {summary['last_error']}")
+            last_error = Text("Last error:", style="error")
+            last_error.append(f" {summary['last_error']}")
+            parts.append(last_error)
+
+        self.console.print(Group(*parts))
 
     def history(self, messages: list[Any], limit: int = 20) -> None:
         for msg in messages[-limit:]:
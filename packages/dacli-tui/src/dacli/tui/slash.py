@@ -73,8 +73,9 @@ def command(*names: str) -> Callable[[Handler], Handler]:
 
 async def dispatch(ctx: ChatContext, user_input: str) -> None:
     """Run the slash command in ``user_input`` (assumes it starts with ``/``)."""
-    cmd = user_input.lower().split()[0]
-    args = user_input.split()[1:]
+    parts = user_input.split()
+    cmd = parts[0].lower()
+    args = parts[1:]
     if cmd in EXIT_COMMANDS:
         ctx.should_exit = True
         return
@@ -172,7 +173,7 @@ async def _why_failed(ctx, args):
 
 @command("/history")
 async def _history(ctx, args):
-    ctx.ui.history(ctx.memory.get_full_history())
+    ctx.ui.history(ctx.memory.get_recent_messages(20))
 
 
 @command("/find")
@@ -218,7 +219,7 @@ async def _transcript(ctx, args):
 
 @command("/sessions")
 async def _sessions(ctx, args):
-    ctx.ui.sessions_table(ctx.memory.list_sessions())
+    ctx.ui.sessions_table(ctx.memory.list_sessions(limit=10))
 
 
 @command("/catalog")
@@ -271,11 +272,20 @@ async def _theme(ctx, args):
         ctx.ui.notice(f"Usage: /theme <name>  ·  available: {available}", style="muted")
 
 
+# Last /prompt preview, keyed by the prompt text: Markdown parses eagerly, and
+# the prompt only changes when SYSTEM.md / AGENTS.md are edited.
+_PROMPT_PREVIEW: dict[str, Markdown] = {}
+
+
 @command("/prompt")
 async def _prompt(ctx, args):
     prompt_content = get_default_system_prompt()
+    preview = _PROMPT_PREVIEW.get(prompt_content)
+    if preview is None:
+        _PROMPT_PREVIEW.clear()
+        preview = _PROMPT_PREVIEW[prompt_content] = Markdown(prompt_content[:2000] + "…")
     ctx.ui.panel(
-        Markdown(prompt_content[:2000] + "…"),
+        preview,
         title="[accent]System prompt[/accent]",
     )
     ctx.ui.notice(
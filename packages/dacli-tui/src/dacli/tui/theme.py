@@ -13,6 +13,7 @@ to ``dark``.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 
 from rich.theme import Theme
 
@@ -53,6 +54,11 @@ class ThemeSpec:
         return list(random.choice(self.banner_palettes))
 
     def rich_theme(self) -> Theme:
+        return self._rich_theme
+
+    @cached_property
+    def _rich_theme(self) -> Theme:
+        # Parsed once per spec; a live /theme switch just re-pushes it.
         return Theme(self.styles)
 
 
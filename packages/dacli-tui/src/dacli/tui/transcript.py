@@ -9,6 +9,7 @@ there — never from the connector.
 from __future__ import annotations
 
 import contextlib
+import functools
 import time
 from dataclasses import dataclass, field
 from typing import Any
@@ -32,6 +33,15 @@ from dacli.tui.render_util import (
 _UNCAPPED = 10**9
 
 
+@functools.cache
+def _sql_lexer():
+    # Resolving a Pygments lexer by name walks its registry on every Syntax
+    # render; a query-heavy turn echoes SQL on each tool call, so build it once.
+    from pygments.lexers import get_lexer_by_name
+
+    return get_lexer_by_name("sql")
+
+
 @dataclass
 class ToolRecord:
     """One tool outcome, addressable by ``rid`` for /expand and /last-error."""
@@ -149,18 +159,30 @@ class TranscriptMixin:
         preview = _arg_preview(args, ellipsis=self.glyphs.ellipsis)
         if preview:
             header.append(f"  {preview}", style="muted")
-        self.console.print(self._guttered(self.glyphs.tool, "tool", header))
+        line = self._guttered(self.glyphs.tool, "tool", header)
 
         sql = args.get("query") or args.get("sql")
-        if isinstance(sql, str) and sql.strip():
-            syntax = Syntax(
+        if not (isinstance(sql, str) and sql.strip()):
+            self.console.print(line)
+            return
+        if self._syntax_highlighting():
+            code: RenderableType = Syntax(
                 sql.strip(),
-                "sql",
+                _sql_lexer(),
                 theme=self.theme.code_theme,
                 word_wrap=True,
                 background_color="default",
             )
-            self.console.print(Padding(syntax, (0, 0, 0, 2 * SPACING["indent"])))
+        else:
+            # Highlighting off or piped: skip Pygments tokenization entirely.
+            code = Text(sql.strip(), style="step")
+        self.console.print(Group(line, Padding(code, (0, 0, 0, 2 * SPACING["indent"]))))
+
+    def _syntax_highlighting(self) -> bool:
+        # Off when disabled in settings, and when output is piped: colors are
+        # stripped there, so Pygments tokenization would be wasted work.
+        flag = getattr(getattr(self.settings, "ui", None), "syntax_highlighting", True)
+        return flag is not False and self.console.is_terminal
 
     def _render_cap(self) -> int:
         # How many rows/items/fields the transcript renders before head+tail
@@ -223,21 +245,22 @@ class TranscriptMixin:
             summary = Text()
             summary.append(f"{self.glyphs.err} ", style="bad")
             summary.append(str(result.error or "failed"), style="error")
-            self.console.print(
+            parts: list[RenderableType] = [
                 Padding(
                     self._guttered(self.glyphs.result, "bad", summary),
                     (0, 0, 0, SPACING["indent"]),
                 )
-            )
+            ]
             hint = _remediation_hint(result.error)
             if hint:
-                self.console.print(
+                parts.append(
                     Padding(
                         Text(f"{self.glyphs.hint} {hint}", style="muted"),
                         (0, 0, 0, 2 * SPACING["indent"]),
                     )
                 )
-            self.console.print()
+            parts.append(Text())
+            self.console.print(Group(*parts))
             return
 
         cap = self._render_cap()
@@ -249,30 +272,33 @@ class TranscriptMixin:
         tier = (result.metadata or {}).get("tier")
         rail = TIER_STYLE.get(tier, "muted") if tier != "safe" else "muted"
 
-        summary = Text()
-        summary.append(f"{self.glyphs.ok} ", style="ok")
-        summary.append(label, style="success")
-        summary.append(
-            f"  {self.glyphs.dot}  {result.execution_time_ms:.0f}ms"
-            f"  {self.glyphs.dot} {rec.rid}",
-            style="muted",
+        summary = Text.assemble(
+            (f"{self.glyphs.ok} ", "ok"),
+            (label, "success"),
+            (
+                f"  {self.glyphs.dot}  {result.execution_time_ms:.0f}ms"
+                f"  {self.glyphs.dot} {rec.rid}",
+                "muted",
+            ),
         )
-        self.console.print(
+        # Summary, body, elision hint and spacer go out as one write.
+        parts = [
             Padding(
                 self._guttered(self.glyphs.result, rail, summary),
                 (0, 0, 0, SPACING["indent"]),
             )
-        )
+        ]
         if body is not None:
-            self.console.print(Padding(body, (0, 0, 0, 2 * SPACING["indent"])))
+            parts.append(Padding(body, (0, 0, 0, 2 * SPACING["indent"])))
         if elided:
-            self.console.print(
+            parts.append(
                 Padding(
                     Text(f"{self.glyphs.hint} /expand {rec.rid} for all {label}", style="muted"),
                     (0, 0, 0, 2 * SPACING["indent"]),
                 )
             )
-        self.console.print()
+        parts.append(Text())
+        self.console.print(Group(*parts))
 
     # ------------------------------------------------------------------
     # Navigability: /expand, /last-error, /find (P11)
@@ -27,6 +27,7 @@ from __future__ import annotations
 from typing import Any
 
 from rich.console import Console, Group, RenderableType
+from rich.highlighter import NullHighlighter
 from rich.markdown import Markdown
 from rich.live import Live
 from rich.padding import Padding
@@ -82,6 +83,10 @@ class DacliUI(StreamMixin, TranscriptMixin, PanelsMixin):
             # Rich honors the NO_COLOR env var natively; ui.no_color forces it.
             no_color = True if getattr(ui_settings, "no_color", False) else None
             self.console = Console(theme=self.theme.rich_theme(), no_color=no_color)
+            if not self.console.is_terminal:
+                # Piped / CI output: styles are stripped anyway, so skip the
+                # per-print repr highlighting pass too.
+                self.console.highlighter = NullHighlighter()
         else:
             # A caller-provided console may not know our semantic styles — push
             # the theme so 'border', 'accent', … resolve everywhere.
@@ -308,32 +313,48 @@ class DacliUI(StreamMixin, TranscriptMixin, PanelsMixin):
     def _notice_icon(self, style: str) -> str:
         # Leading icon per notice style — success/warning/error read at a
         # glance without reading the text (and without relying on color).
-        return {
-            "success": self.glyphs.ok,
-            "warning": self.glyphs.warn,
-            "error": self.glyphs.err,
-            "bad": self.glyphs.err,
-            "info": self.glyphs.info,
-        }.get(style, "")
+        return self.glyphs.notice_icons.get(style, "")
 
-    def notice(self, message: str, style: str = "info") -> None:
+    def _notice_text(self, message: str, style: str = "info") -> Text:
         icon = self._notice_icon(style)
         prefix = f"{icon} " if icon else ""
-        self.console.print(f"[{style}]{prefix}{message}[/{style}]")
+        return self.console.render_str(f"[{style}]{prefix}{message}[/{style}]")
 
-    def error(self, message: str) -> None:
-        self._clear_progress()
-        self.console.print(
+    def notice(self, message: str, style: str = "info") -> None:
+        self.console.print(self._notice_text(message, style))
+
+    def _error_body(self, message: str) -> RenderableType:
+        parts: list[RenderableType] = [
             self._guttered(self.glyphs.err, "bad", Text(message, style="error"))
-        )
+        ]
         hint = _remediation_hint(message)
         if hint:
-            self.console.print(
+            parts.append(
                 Padding(
                     Text(f"{self.glyphs.hint} {hint}", style="muted"),
                     (0, 0, 0, SPACING["indent"]),
                 )
             )
+        return Group(*parts)
+
+    def error(self, message: str) -> None:
+        self._clear_progress()
+        self.console.print(self._error_body(message))
+
+    def turn_end(self, *, error: str | None = None, needs_input: bool = False) -> None:
+        """Close an agent turn: error, hand-off notice and spacer in one write."""
+        self._clear_progress()
+        parts: list[RenderableType] = []
+        if error:
+            parts.append(self._error_body(f"Error: {error}"))
+        if needs_input:
+            parts.append(
+                self._notice_text(
+                    "⏳ Agent is waiting for your input to continue.", style="warning"
+                )
+            )
+        parts.append(Text())
+        self.console.print(Group(*parts))
 
     def panel(
         self, renderable: RenderableType, title: str, style: str = "border"
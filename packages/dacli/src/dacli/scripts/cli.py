@@ -1,49 +1,96 @@
+from __future__ import annotations
+
 import asyncio
 import os
 import click
 
 from pathlib import Path
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.table import Table
-from rich.prompt import Confirm
+from typing import TYPE_CHECKING
 
 from dacli.core import __author__, __version__, paths
-from dacli.config.settings import (
-    load_config,
-    Settings,
-)
-from dacli.connectors.registry import (
-    ConnectorRegistry,
-    CONNECTORS_CONFIG_PATH,
-)
-from dacli.core.host import DacliHost
 from dacli.core.logging_setup import get_logger, setup_logging
-from dacli.core.memory import AgentMemory
-from dacli.governance.audit import AuditLedger
-from dacli.prompts.system_prompt import (
-    get_default_system_prompt,
-    save_system_prompt,
-)
-from dacli.tui import DacliUI
-from dacli.tui import reports
+
+# The agent stack (host, memory, audit ledger, prompts, connector registry, the
+# pydantic settings model) and the heavier rich renderables are imported inside
+# the commands that use them, so `dacli --version` / `--help` pay for Click and
+# little else.
+if TYPE_CHECKING:
+    from dacli.config.settings import Settings
+
+log = get_logger(__name__)
 
 # Re-exported so callers/tests keep importing these from here after the cli.py
 # split (P10): the slash registry moved to tui.slash, the REPL to
-# tui.chat_session, the renderers to tui.reports.
-from dacli.tui.slash import SlashCommandCompleter  # noqa: F401
-from dacli.tui.chat_session import run_chat, _ctx_pct  # noqa: F401
+# tui.chat_session, the renderers to tui.reports. Resolved lazily (PEP 562):
+# the REPL stack drags in prompt_toolkit, which only chat needs — `--version`,
+# `--help` and the one-shot commands shouldn't pay for it.
+_LAZY_EXPORTS = {
+    "SlashCommandCompleter": "dacli.tui.slash",
+    "run_chat": "dacli.tui.chat_session",
+    "_ctx_pct": "dacli.tui.chat_session",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    return getattr(importlib.import_module(module), name)
+
+
+class _Deferred:
+    # Builds the wrapped object on first attribute access. DacliUI pulls in
+    # rich.markdown/syntax and the theme tables, which `--version` never renders.
+    def __init__(self, factory):
+        self._factory = factory
+        self._obj = None
+
+    def __getattr__(self, name):
+        if self._obj is None:
+            self._obj = self._factory()
+        return getattr(self._obj, name)
+
+
+def _build_ui():
+    from dacli.tui import DacliUI
+
+    return DacliUI(version=__version__, author=__author__)
 
-log = get_logger(__name__)
 
 # Module-level UI for the standalone (non-chat) click commands. The interactive
 # chat builds its own themed instance once settings are loaded.
-ui = DacliUI(version=__version__, author=__author__)
-console = ui.console
+ui = _Deferred(_build_ui)
+console = _Deferred(lambda: ui.console)
+
+
+def load_config(config_path=None):
+    # Module-level so tests can patch dacli.scripts.cli.load_config; the
+    # settings model (pydantic) is only imported once a command needs it.
+    from dacli.config.settings import load_config as _load_config
+
+    return _load_config(config_path)
+
+
+def _open_memory(settings=None):
+    # The session store the one-shot commands read, built from the configured
+    # agent paths (AgentMemory's defaults when there is no settings object).
+    from dacli.core.memory import AgentMemory
+
+    if settings is None:
+        return AgentMemory()
+    return AgentMemory(
+        state_path=settings.agent.state_path,
+        history_path=settings.agent.history_path,
+        memory_window=settings.agent.memory_window,
+    )
 
 
 def _print_audit(ledger, session_id, *, full=False, limit=20, header=None, target=None):
     # Compat shim around tui.reports.print_audit (which takes an explicit UI).
+    from dacli.tui import reports
+
     reports.print_audit(
         ledger, session_id, target or ui, full=full, limit=limit, header=header
     )
@@ -61,11 +108,7 @@ def _open_transcript(config, session):
         )
         return
     settings = load_config(config)
-    memory = AgentMemory(
-        state_path=settings.agent.state_path,
-        history_path=settings.agent.history_path,
-        memory_window=settings.agent.memory_window,
-    )
+    memory = _open_memory(settings)
     if session and not memory.load_session(session):
         console.print(f"[error]Session not found: {session}[/error]")
         return
@@ -96,7 +139,7 @@ def cli(ctx, config, session, version, setup, debug, transcript):
     # P02: --version short-circuits before any state setup so it touches no FS.
     # (--help is Click's eager option — it exits before this body runs.)
     if version:
-        console.print(f"DACLI version {__version__}")
+        click.echo(f"DACLI version {__version__}")
         return
 
     if transcript:
@@ -134,10 +177,11 @@ def cli(ctx, config, session, version, setup, debug, transcript):
 @click.pass_context
 def chat(ctx, config, session, run_setup):
     """Start interactive chat with the agent."""
+    from dacli.tui.chat_session import run_chat
+
     config_path = config or ctx.obj.get("config_path")
     session_id = session or ctx.obj.get("session_id")
     force_setup = run_setup or ctx.obj.get("run_setup", False)
-
     asyncio.run(run_chat(config_path, session_id, force_setup=force_setup))
 
 
@@ -150,6 +194,8 @@ def setup(config, session):
     Onboarding is conversational now (M12): there's no connector wizard. This is
     ``dacli chat --setup`` — it opens the agent and offers to /connect a seed.
     """
+    from dacli.tui.chat_session import run_chat
+
     asyncio.run(run_chat(config, session, force_setup=True))
 
 
@@ -169,6 +215,8 @@ def _find_config_template() -> Path | None:
 @click.option("--config", "-c", type=click.Path(), help="Path to config.yaml file")
 def init(config):
     # Initialize a new config.yaml file.
+    from rich.prompt import Confirm
+
     target_path = Path(config) if config else Path("config.yaml")
 
     if target_path.exists() and not Confirm.ask(
@@ -181,12 +229,9 @@ def init(config):
     if template is not None:
         target_path.write_text(template.read_text(encoding="utf-8"), encoding="utf-8")
     else:
-        import yaml
+        from dacli.config.settings import Settings, save_config
 
-        target_path.write_text(
-            yaml.dump(Settings().model_dump(), default_flow_style=False),
-            encoding="utf-8",
-        )
+        save_config(Settings(), str(target_path))
 
     console.print(f"[success]Created {target_path}[/success]")
     console.print(
@@ -263,16 +308,13 @@ def why_failed(source, dag_id, run_id, apply_fix, config, as_json):
     normal classify → approve → verify → rollback gate.
     """
     from dacli.config.settings import ConnectorConfig
+    from dacli.core.host import DacliHost
     from dacli.core.why_failed import explain_failure
 
     settings = load_config(config)
     source = source or ("airflow" if dag_id else "dbt")
 
-    memory = AgentMemory(
-        state_path=settings.agent.state_path,
-        history_path=settings.agent.history_path,
-        memory_window=settings.agent.memory_window,
-    )
+    memory = _open_memory(settings)
     # Build the agent (no initialize() -> no network) for its governed dispatcher
     # and lineage store — the same pattern as `diff` and `context`.
     agent = DacliHost(settings=settings, memory=memory)
@@ -308,8 +350,9 @@ def validate(config):
 @cli.command()
 def sessions():
     # List available sessions.
-    memory = AgentMemory()
-    session_list = memory.list_sessions()
+    from rich.table import Table
+
+    session_list = _open_memory().list_sessions()
 
     if not session_list:
         console.print("[dim]No sessions found.[/dim]")
@@ -337,6 +380,8 @@ def sessions():
 @click.option("--config", "-c", type=click.Path(), help="Path to config.yaml file")
 def load(session_id, config):
     """Load and resume a previous session."""
+    from dacli.tui.chat_session import run_chat
+
     asyncio.run(run_chat(config, session_id))
 
 
@@ -364,6 +409,8 @@ def catalog(config, connector):
 @click.option("--connector", type=str, default=None, help="Filter by connector id")
 def schema(object_name, config, connector):
     """Show cached columns/row-count/last-verified for one object (F-6)."""
+    from dacli.tui import reports
+
     reports.print_schema(ui, _open_catalog(config), object_name, connector)
 
 
@@ -383,12 +430,11 @@ def schema(object_name, config, connector):
 )
 def context(config, session, task, explain):
     """Inspect the assembled context (Context Constructor)."""
+    from dacli.core.host import DacliHost
+    from dacli.tui import reports
+
     settings = load_config(config)
-    memory = AgentMemory(
-        state_path=settings.agent.state_path,
-        history_path=settings.agent.history_path,
-        memory_window=settings.agent.memory_window,
-    )
+    memory = _open_memory(settings)
     if session and not memory.load_session(session):
         console.print(f"[error]Session not found: {session}[/error]")
         return
@@ -425,13 +471,10 @@ def diff_cmd(connector, table_a, table_b, config, sample):
     Never mutates anything.
     """
     from dacli.core.datadiff import run_data_diff
+    from dacli.core.host import DacliHost
 
     settings = load_config(config)
-    memory = AgentMemory(
-        state_path=settings.agent.state_path,
-        history_path=settings.agent.history_path,
-        memory_window=settings.agent.memory_window,
-    )
+    memory = _open_memory(settings)
     # Build the agent (no initialize() -> no network) just for its governed
     # dispatcher — the same pattern as the `context` command.
     agent = DacliHost(settings=settings, memory=memory)
@@ -463,13 +506,10 @@ def cost_cmd(connector, estimate_sql, want_session, limit, config, as_json):
     databricks.
     """
     from dacli.core import cost_advisor
+    from dacli.core.host import DacliHost
 
     settings = load_config(config)
-    memory = AgentMemory(
-        state_path=settings.agent.state_path,
-        history_path=settings.agent.history_path,
-        memory_window=settings.agent.memory_window,
-    )
+    memory = _open_memory(settings)
     # Build the agent (no initialize() -> no network) for its governed dispatcher
     # — the same pattern as `diff` and `why-failed`.
     agent = DacliHost(settings=settings, memory=memory)
@@ -534,6 +574,8 @@ def assert_define(name, connector, table, metric, op, threshold, column, remedia
 @assert_grp.command(name="list")
 def assert_list():
     """List saved assertions."""
+    from rich.table import Table
+
     from dacli.core.quality import load_assertions
 
     store = load_assertions()
@@ -575,6 +617,7 @@ def assert_run(name, apply_fix, config, as_json):
     normal classify → approve → verify → rollback gate. Exits non-zero on a
     breach (or a read error) so CI can gate on data quality.
     """
+    from dacli.core.host import DacliHost
     from dacli.core.quality import evaluate, load_assertions
 
     settings = load_config(config)
@@ -588,11 +631,7 @@ def assert_run(name, apply_fix, config, as_json):
         console.print("[muted]No assertions to run. Define one with `dacli assert define`.[/muted]")
         return
 
-    memory = AgentMemory(
-        state_path=settings.agent.state_path,
-        history_path=settings.agent.history_path,
-        memory_window=settings.agent.memory_window,
-    )
+    memory = _open_memory(settings)
     # Build the agent (no initialize() -> no network) just for its governed
     # dispatcher — the same pattern as `diff` and `why-failed`.
     agent = DacliHost(settings=settings, memory=memory)
@@ -724,6 +763,8 @@ def runbook_run(name, params, config, llm_script, as_json):
 )
 def audit(config, session, limit, full):
     """Reconstruct governance decisions: why the agent did (or didn't) act."""
+    from dacli.governance.audit import AuditLedger
+
     settings = load_config(config)
     gov = getattr(settings, "governance", None)
     state_dir = str(Path(settings.agent.state_path).parent)
@@ -964,6 +1005,11 @@ def replay_cmd(scenario_file, as_json):
 def prompt(output, edit):
     # View or customize the system prompt. A user SYSTEM.md replaces the packaged
     # core; AGENTS.md adds operating notes on top (M14).
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
+    from dacli.prompts.system_prompt import get_default_system_prompt, save_system_prompt
+
     current_prompt = get_default_system_prompt()
     override = paths.system_md_target()
 
@@ -1018,6 +1064,8 @@ async def _validate_connections(settings: Settings):
     # Validate all discovered connectors via a live health check, run
     # concurrently so total wait is the slowest check, not the sum. Results
     # are printed in catalog order after the gather.
+    from dacli.connectors.registry import CONNECTORS_CONFIG_PATH, ConnectorRegistry
+
     registry = ConnectorRegistry(settings, config_path=CONNECTORS_CONFIG_PATH)
     catalog = registry.get_catalog()
 
@@ -1,12 +1,14 @@
 import asyncio
 from typing import Any
 
-import boto3
 from botocore.exceptions import ClientError
 
 
 def _make_client(cfg: dict[str, Any]):
     """Create a boto3 Lambda client using the supplied configuration."""
+    # boto3 costs ~200ms to import; pay it on first use, not at extension load.
+    import boto3
+
     return boto3.client(
         "lambda",
         aws_access_key_id=cfg["access_key"],
@@ -23,6 +25,16 @@ def register(api):
     api.config_field("secret_key", secret=True, required=True, description="AWS Secret Access Key")
     api.config_field("region", required=True, description="AWS region, e.g. us-east-1")
 
+    # One client per credentials + region, reused across calls (see the s3 seed).
+    state: dict[str, Any] = {"client": None, "key": None}
+
+    def _client(cfg: dict[str, Any]):
+        key = (cfg.get("access_key"), cfg.get("secret_key"), cfg.get("region"))
+        if state["client"] is None or state["key"] != key:
+            state["client"] = _make_client(cfg)
+            state["key"] = key
+        return state["client"]
+
     # ----------------------------------------------------------------------
     # Helper: run blocking boto3 calls in a thread
     # ----------------------------------------------------------------------
@@ -41,7 +53,7 @@ def register(api):
     )
     async def list_functions(args, ctx):
         cfg = api.config()
-        client = _make_client(cfg)
+        client = _client(cfg)
 
         def _list():
             paginator = client.get_paginator("list_functions")
@@ -70,7 +82,7 @@ def register(api):
     )
     async def get_function(args, ctx):
         cfg = api.config()
-        client = _make_client(cfg)
+        client = _client(cfg)
 
         def _get():
             return client.get_function(FunctionName=args["function_name"])
@@ -127,7 +139,7 @@ def register(api):
         import zipfile
 
         cfg = api.config()
-        client = _make_client(cfg)
+        client = _client(cfg)
 
         inline_code = args.get("inline_code")
         s3_bucket = args.get("s3_bucket")
@@ -200,7 +212,7 @@ def register(api):
         import zipfile
 
         cfg = api.config()
-        client = _make_client(cfg)
+        client = _client(cfg)
 
         inline_code = args.get("inline_code")
         s3_bucket = args.get("s3_bucket")
@@ -246,7 +258,7 @@ def register(api):
     )
     async def delete_function(args, ctx):
         cfg = api.config()
-        client = _make_client(cfg)
+        client = _client(cfg)
 
         def _delete():
             return client.delete_function(FunctionName=args["function_name"])
@@ -271,7 +283,7 @@ def register(api):
     )
     async def describe_function(args, ctx):
         cfg = api.config()
-        client = _make_client(cfg)
+        client = _client(cfg)
 
         def _describe():
             return client.get_function_configuration(FunctionName=args["function_name"])
@@ -28,6 +28,17 @@ def register(api):
         session = boto3.session.Session(**session_kwargs)
         return session.client("dynamodb")
 
+    # Reused across calls like the s3 seed's client; the session token is part of
+    # the key, so refreshed STS credentials get a fresh client.
+    state: dict[str, Any] = {"client": None, "key": None}
+
+    def _client(cfg: dict[str, Any]):
+        key = (cfg.get("access_key"), cfg.get("secret_key"), cfg.get("session_token"), cfg.get("region"))
+        if state["client"] is None or state["key"] != key:
+            state["client"] = _make_client(cfg)
+            state["key"] = key
+        return state["client"]
+
     def _resolve_table(args, cfg):
         """Resolve table from tool args, falling back to config default."""
         return args.get("table") or cfg.get("table")
@@ -50,7 +61,7 @@ def register(api):
         table = _resolve_table(args, cfg)
         if not table:
             return ctx.fail("No table specified and none configured")
-        client = _make_client(cfg)
+        client = _client(cfg)
 
         limit = args.get("limit")
         scan_kwargs = {"TableName": table}
@@ -88,7 +99,7 @@ def register(api):
         table = _resolve_table(args, cfg)
         if not table:
             return ctx.fail("No table specified and none configured")
-        client = _make_client(cfg)
+        client = _client(cfg)
 
         key = args.get("key")
         if not isinstance(key, dict) or not key:
@@ -134,7 +145,7 @@ def register(api):
         table = _resolve_table(args, cfg)
         if not table:
             return ctx.fail("No table specified and none configured")
-        client = _make_client(cfg)
+        client = _client(cfg)
 
         item = args.get("item")
         if not isinstance(item, dict) or not item:
@@ -3,22 +3,87 @@
 A reference ``register(api)`` extension (reporting/02 seed set), replacing the
 old ``connectors/github`` Connector. Token + repo coordinates come from
 ``api.config()``; the httpx client is built lazily and cached in the registration
-closure. The workflow-dispatch operations of the old connector are intentionally
+closure, alongside an ETag cache so unchanged contents revalidate with a 304
+(no body, no rate-limit cost) instead of a full download. The workflow-dispatch operations of the old connector are intentionally
 left out — the seed is a worked example of the file path, not a full port.
 """
 
 from __future__ import annotations
 
-import base64
+import asyncio
+import random
+import time
+from collections import OrderedDict
+from importlib.util import find_spec
 from types import SimpleNamespace
 from typing import Any
-from urllib.parse import urlparse
+from urllib.parse import quote, urlparse
 
+from dacli.core.fastjson import dumps_bytes, loads
 from dacli.core.verify import data_has_keys, result_succeeded
 
+try:  # SIMD base64 (the [github] extra); pays off on large file round-trips
+    from pybase64 import b64decode, b64encode_as_string
+except ImportError:
+    from base64 import b64decode, b64encode
+
+    def b64encode_as_string(s: bytes) -> str:
+        return b64encode(s).decode("ascii")
+
+
+# Bodies go out pre-encoded (orjson when installed, via dacli.core.fastjson) —
+# push bodies carry the whole file base64-encoded, so serialization is not free.
+_JSON_BODY = {"Content-Type": "application/json"}
+# In-flight cap per process (the usual per-host connection budget); callers that
+# fan out with gather queue here instead of bursting the pool and the rate limit.
+_MAX_IN_FLIGHT = 64
+# Longest we will hold a call waiting for the hourly budget to reset; beyond this
+# the call goes out and GitHub's own rate-limit error reaches the agent.
+_MAX_RESET_WAIT_S = 60
+# Attempts per call for throttled (429 / secondary-limit 403) and 5xx answers.
+_MAX_ATTEMPTS = 4
+# Git tree entry types -> the Contents API names list_github_directory reports.
+# ETag cache bounds: least-recently-used urls are evicted past the entry cap, and
+# responses larger than the byte cap (big files, whole-repo trees) are not kept.
+_ETAG_CACHE_SIZE = 128
+_ETAG_CACHE_MAX_BYTES = 256 * 1024
+_TREE_TYPES = {"blob": "file", "tree": "dir", "commit": "submodule"}
+# File modes push_github_files may set: a regular file and an executable one.
+_BLOB_MODES = ("100644", "100755")
+
+
+def _retryable(method: str, resp) -> bool:
+    # Throttled calls were not processed, so any method may go again; a 5xx is
+    # only retried for GET — a POST may have landed (a commit, a tree) anyway.
+    status = resp.status_code
+    if status == 429 or (status == 403 and "Retry-After" in resp.headers):
+        return True
+    return method == "GET" and 500 <= status < 600
+
+
+def _backoff(attempt: int) -> float:
+    return min(2 ** attempt + random.random(), 30)  # jittered exponential backoff
+
+
+def _retry_delay(resp, attempt: int) -> float:
+    after = resp.headers.get("Retry-After", "")
+    if after.isdigit():
+        return min(float(after), _MAX_RESET_WAIT_S)
+    return _backoff(attempt)
+
+
+def _dir_entries(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Project a Contents API directory listing onto the fields the tools report."""
+    return [{"name": i.get("name"), "type": i.get("type"), "path": i.get("path"),
+             "size": i.get("size", 0)} for i in items]
+
 
 def register(api):
-    state: dict[str, Any] = {"client": None}
+    # etags: GET url (repo, path and ref included) -> (ETag, parsed payload), LRU
+    # rl_*: the last response's X-RateLimit-Remaining / -Reset (epoch seconds).
+    state: dict[str, Any] = {"client": None, "etags": OrderedDict(),
+                             "gate": asyncio.Semaphore(_MAX_IN_FLIGHT),
+                             "rl_remaining": None, "rl_reset": 0}
 
     api.config_field("token", secret=True, description="GitHub personal access token")
     api.config_field("owner", description="Repository owner")
@@ -35,12 +100,24 @@ def register(api):
             if len(parts) >= 2:
                 owner = owner or parts[0]
                 repo = repo or parts[1].replace(".git", "")
+        branch = c.get("branch", "main") or "main"
+        # URL-safe forms: a branch or path may hold '#', '?', '%' or spaces.
         return SimpleNamespace(
             token=c.get("token", "") or "", owner=owner, repo=repo,
-            branch=c.get("branch", "main") or "main", timeout=c.get("timeout", 60),
+            branch=branch, quoted_branch=quote(branch, safe="/"), timeout=c.get("timeout", 60),
+            prefix=f"/repos/{quote(owner, safe='')}/{quote(repo, safe='')}",
         )
 
+    def contents_url(conf: SimpleNamespace, path: str, *, ref: bool = True) -> str:
+        url = f"{conf.prefix}/contents/{quote(path, safe='/')}"
+        return f"{url}?ref={conf.quoted_branch}" if ref else url
+
     def client(conf: SimpleNamespace):
+        # One long-lived client for every call: keep-alive connections to
+        # api.github.com skip the TLS handshake, and with h2 installed
+        # (``dacli[github]``) concurrent calls multiplex over one connection.
+        # No custom transport: httpx would ignore http2/limits and the
+        # HTTPS_PROXY environment; connect failures are retried in _request.
         if state["client"] is None:
             import httpx
             state["client"] = httpx.AsyncClient(
@@ -51,13 +128,99 @@ def register(api):
                     "X-GitHub-Api-Version": "2022-11-28",
                 },
                 timeout=conf.timeout,
+                http2=find_spec("h2") is not None,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100,
+                                    keepalive_expiry=60),
             )
         return state["client"]
 
+    def _close(_reason) -> None:
+        # Reload re-registers the seed with a fresh closure; release the old pool.
+        c, state["client"] = state["client"], None
+        state["etags"].clear()
+        if c is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # no loop left to close on; the sockets die with the process
+        state["closing"] = loop.create_task(c.aclose())  # held so it is not GC-cancelled
+
+    api.on("session_shutdown", _close)
+
+    def tree_url(conf: SimpleNamespace) -> str:
+        # The trees endpoint takes a ref as the tree-ish: no branch -> sha lookup.
+        return f"{conf.prefix}/git/trees/{conf.quoted_branch}?recursive=1"
+
+    async def _request(conf, method: str, url: str, **kw):
+        """Send one GitHub API call through the in-flight cap and the rate-limit budget.
+
+        Throttled and (for GET) 5xx answers are retried, honouring ``Retry-After``.
+        A failed connect is retried for any method: nothing reached the server.
+        """
+        import httpx
+
+        for attempt in range(_MAX_ATTEMPTS):
+            if state["rl_remaining"] == 0:
+                # Waited out before taking an in-flight slot: a parked call must not
+                # hold the gate against calls that are free to go.
+                wait = state["rl_reset"] - time.time()
+                if 0 < wait <= _MAX_RESET_WAIT_S:
+                    await asyncio.sleep(wait)
+                state["rl_remaining"] = None
+            async with state["gate"]:
+                try:
+                    resp = await client(conf).request(method, url, **kw)
+                except httpx.ConnectError:
+                    if attempt == _MAX_ATTEMPTS - 1:
+                        raise
+                    resp = None
+            if resp is None:
+                await asyncio.sleep(_backoff(attempt))
+                continue
+            if (remaining := resp.headers.get("X-RateLimit-Remaining")) is not None:
+                state["rl_remaining"] = int(remaining)
+                state["rl_reset"] = int(resp.headers.get("X-RateLimit-Reset", 0))
+            if attempt == _MAX_ATTEMPTS - 1 or not _retryable(method, resp):
+                break
+            await asyncio.sleep(_retry_delay(resp, attempt))
+        return resp
+
+    async def _cached_get(conf, url: str):
+        """GET *url* as ``(resp, data)``; ``data`` is None unless it succeeded.
+
+        Sends ``If-None-Match`` when the url was fetched before: a 304 carries no
+        body and costs no rate limit, so the cached payload is served instead.
+        """
+        etags = state["etags"]
+        cached = etags.get(url)
+        resp = await _request(
+            conf, "GET", url, headers={"If-None-Match": cached[0]} if cached else None)
+        if resp.status_code == 304 and cached:
+            etags.move_to_end(url)
+            return resp, cached[1]
+        etags.pop(url, None)
+        if resp.status_code != 200:
+            return resp, None
+        data = loads(resp.content)
+        etag = resp.headers.get("ETag")
+        if etag and len(resp.content) <= _ETAG_CACHE_MAX_BYTES:
+            etags[url] = (etag, data)
+            if len(etags) > _ETAG_CACHE_SIZE:
+                etags.popitem(last=False)
+        return resp, data
+
+    async def _get_contents(conf, path: str):
+        return await _cached_get(conf, contents_url(conf, path))
+
+    def _forget(conf, path: str) -> None:
+        # A write changes the file and the branch tree; both revalidate from scratch.
+        state["etags"].pop(contents_url(conf, path), None)
+        state["etags"].pop(tree_url(conf), None)
+
     async def _get_sha(conf, path: str) -> str | None:
-        resp = await client(conf).get(
-            f"/repos/{conf.owner}/{conf.repo}/contents/{path}?ref={conf.branch}")
-        return resp.json().get("sha") if resp.status_code == 200 else None
+        _resp, data = await _get_contents(conf, path)
+        return data.get("sha") if isinstance(data, dict) else None
 
     @api.tool(
         name="list_github_directory",
@@ -71,17 +234,41 @@ def register(api):
     async def list_github_directory(args, ctx):
         conf = gh()
         path = args.get("path", "")
-        resp = await client(conf).get(
-            f"/repos/{conf.owner}/{conf.repo}/contents/{path}?ref={conf.branch}")
+        resp, data = await _get_contents(conf, path)
         if resp.status_code == 404:
             return ctx.fail(f"Directory not found: {path}", operation="list_directory")
-        resp.raise_for_status()
-        data = resp.json()
+        if data is None:
+            resp.raise_for_status()
         if not isinstance(data, list):
             return ctx.fail(f"Path '{path}' is a file, not a directory.", operation="list_directory")
-        entries = [{"name": i.get("name"), "type": i.get("type"),
-                    "path": i.get("path"), "size": i.get("size", 0)} for i in data]
-        return ctx.ok({"path": path or "/", "entries": entries}, operation="list_directory")
+        return ctx.ok({"path": path or "/", "entries": _dir_entries(data)},
+                      operation="list_directory")
+
+    @api.tool(
+        name="list_github_tree",
+        description=("List every file and directory under a path, recursively, in one "
+                     "request (Git Trees API). Prefer this over walking directories."),
+        parameters={"path": {"type": "string", "description": "Path prefix (empty for the whole repo)."}},
+        risk="safe",
+        postconditions=[data_has_keys("entries", name="lists_entries")],
+        display_name="List Tree",
+        category="read",
+    )
+    async def list_github_tree(args, ctx):
+        conf = gh()
+        path = args.get("path", "").strip("/")
+        resp, data = await _cached_get(conf, tree_url(conf))
+        if resp.status_code == 404:
+            return ctx.fail(f"Branch not found: {conf.branch}", operation="list_tree")
+        if data is None:
+            resp.raise_for_status()
+        prefix = f"{path}/" if path else ""
+        entries = [{"name": i["path"].rpartition("/")[2],
+                    "type": _TREE_TYPES.get(i.get("type"), i.get("type")),
+                    "path": i["path"], "size": i.get("size", 0)}
+                   for i in data.get("tree", []) if i["path"].startswith(prefix)]
+        return ctx.ok({"path": path or "/", "entries": entries,
+                       "truncated": bool(data.get("truncated"))}, operation="list_tree")
 
     @api.tool(
         name="read_github_file",
@@ -95,18 +282,15 @@ def register(api):
     async def read_github_file(args, ctx):
         conf = gh()
         path = args.get("path", "")
-        resp = await client(conf).get(
-            f"/repos/{conf.owner}/{conf.repo}/contents/{path}?ref={conf.branch}")
+        resp, data = await _get_contents(conf, path)
         if resp.status_code == 404:
             return ctx.fail(f"File not found: {path}", operation="read_file")
-        resp.raise_for_status()
-        data = resp.json()
+        if data is None:
+            resp.raise_for_status()
         if isinstance(data, list):
-            entries = [{"name": i.get("name"), "type": i.get("type"),
-                        "path": i.get("path"), "size": i.get("size", 0)} for i in data]
-            return ctx.ok({"path": path or "/", "entries": entries, "is_directory": True},
+            return ctx.ok({"path": path or "/", "entries": _dir_entries(data), "is_directory": True},
                           operation="read_file")
-        content = base64.b64decode(data.get("content")).decode("utf-8")
+        content = b64decode(data.get("content")).decode("utf-8")
         return ctx.ok(
             {"path": data.get("path"), "content": content,
              "sha": data.get("sha"), "size": data.get("size", 0)},
@@ -131,14 +315,16 @@ def register(api):
         path, content = args.get("path", ""), args.get("content", "")
         sha = await _get_sha(conf, path)
         body = {"message": args.get("message", ""), "branch": conf.branch,
-                "content": base64.b64encode(content.encode("utf-8")).decode("utf-8")}
+                "content": b64encode_as_string(content.encode("utf-8"))}
         if sha:
             body["sha"] = sha
-        resp = await client(conf).put(
-            f"/repos/{conf.owner}/{conf.repo}/contents/{path}", json=body)
+        resp = await _request(
+            conf, "PUT", contents_url(conf, path, ref=False),
+            content=dumps_bytes(body), headers=_JSON_BODY)
+        _forget(conf, path)
         if resp.status_code not in (200, 201):
             return ctx.fail(f"HTTP {resp.status_code}: {resp.text}", operation="create_or_update_file")
-        data = resp.json()
+        data = loads(resp.content)
         return ctx.ok(
             {"path": data["content"]["path"], "sha": data["content"]["sha"],
              "commit_sha": data["commit"]["sha"], "commit_message": data["commit"]["message"],
@@ -146,6 +332,91 @@ def register(api):
             operation="create_or_update_file",
         )
 
+    async def _send(conf, method: str, url: str, body: dict):
+        """Send a JSON body; ``(resp, data)`` with ``data`` None on a non-2xx."""
+        resp = await _request(conf, method, url, content=dumps_bytes(body), headers=_JSON_BODY)
+        return resp, (loads(resp.content) if 200 <= resp.status_code < 300 else None)
+
+    @api.tool(
+        name="push_github_files",
+        description=("Create or update several files in ONE commit (Git Data API). "
+                     "Prefer this over repeated push_github_file calls."),
+        parameters={
+            "files": {
+                "type": "array",
+                "items": {"type": "object",
+                          "properties": {"path": {"type": "string"}, "content": {"type": "string"},
+                                         "mode": {"type": "string", "enum": list(_BLOB_MODES),
+                                                  "description": "Defaults to the file's "
+                                                                 "current mode, else 100644."}},
+                          "required": ["path", "content"]},
+            },
+            "message": {"type": "string", "description": "Commit message."},
+        },
+        risk="write",
+        postconditions=[data_has_keys("commit_sha", name="commit_landed")],
+        display_name="Push Files",
+        category="write",
+    )
+    async def push_github_files(args, ctx):
+        # ref -> parent commit -> its tree, then one new tree (contents inline, so
+        # no per-file blob upload), one commit, one ref move: 5 calls for N files,
+        # plus one base-tree read when a file leaves its mode to be inherited.
+        conf = gh()
+        files = args.get("files") or []
+        op = "create_or_update_files"
+        if not files:
+            return ctx.fail("No files to push.", operation=op)
+        for i, f in enumerate(files):
+            if not (isinstance(f, dict) and isinstance(f.get("path"), str) and f["path"]
+                    and isinstance(f.get("content"), str)):
+                return ctx.fail(f"files[{i}] needs a string 'path' and 'content'.", operation=op)
+            if f.get("mode", _BLOB_MODES[0]) not in _BLOB_MODES:
+                return ctx.fail(f"files[{i}] mode must be one of {', '.join(_BLOB_MODES)}.",
+                                operation=op)
+
+        def http_fail(resp):
+            return ctx.fail(f"HTTP {resp.status_code}: {resp.text}", operation=op)
+
+        resp = await _request(conf, "GET", f"{conf.prefix}/git/ref/heads/{conf.quoted_branch}")
+        if resp.status_code != 200:
+            return http_fail(resp)
+        parent = loads(resp.content)["object"]["sha"]
+        resp = await _request(conf, "GET", f"{conf.prefix}/git/commits/{parent}")
+        if resp.status_code != 200:
+            return http_fail(resp)
+        base = loads(resp.content)["tree"]["sha"]
+        modes: dict[str, str] = {}
+        if any("mode" not in f for f in files):
+            # Keep an existing file's mode (the executable bit) unless one is given;
+            # the base tree is addressed by sha, so its ETag never goes stale.
+            base_url = f"{conf.prefix}/git/trees/{quote(base, safe='')}?recursive=1"
+            _resp, listing = await _cached_get(conf, base_url)
+            modes = {i["path"]: i["mode"] for i in (listing or {}).get("tree", [])
+                     if i.get("mode") in _BLOB_MODES}
+        entries = [{"path": f["path"], "mode": f.get("mode") or modes.get(f["path"], "100644"),
+                    "type": "blob", "content": f["content"]} for f in files]
+        resp, tree = await _send(conf, "POST", f"{conf.prefix}/git/trees",
+                                 {"base_tree": base, "tree": entries})
+        if tree is None:
+            return http_fail(resp)
+        resp, commit = await _send(conf, "POST", f"{conf.prefix}/git/commits",
+                                   {"message": args.get("message", ""), "tree": tree["sha"],
+                                    "parents": [parent]})
+        if commit is None:
+            return http_fail(resp)
+        resp, moved = await _send(conf, "PATCH", f"{conf.prefix}/git/refs/heads/{conf.quoted_branch}",
+                                  {"sha": commit["sha"]})
+        for f in files:
+            _forget(conf, f["path"])
+        if moved is None:
+            return http_fail(resp)
+        return ctx.ok(
+            {"paths": [f["path"] for f in files], "commit_sha": commit["sha"],
+             "commit_message": commit.get("message", "")},
+            operation=op,
+        )
+
     @api.tool(
         name="delete_github_file",
         description="Delete a file from the repository.",
@@ -161,11 +432,13 @@ def register(api):
         sha = await _get_sha(conf, path)
         if not sha:
             return ctx.fail(f"File not found: {path}", operation="delete_file")
-        resp = await client(conf).request(
-            "DELETE", f"/repos/{conf.owner}/{conf.repo}/contents/{path}?ref={conf.branch}",
-            json={"message": args.get("message", ""), "sha": sha})
+        resp = await _request(
+            conf, "DELETE", contents_url(conf, path),
+            content=dumps_bytes({"message": args.get("message", ""), "sha": sha}),
+            headers=_JSON_BODY)
+        _forget(conf, path)
         if resp.status_code != 200:
             return ctx.fail(f"HTTP {resp.status_code}: {resp.text}", operation="delete_file")
-        data = resp.json()
+        data = loads(resp.content)
         return ctx.ok({"path": path, "deleted": True, "commit_sha": data["commit"]["sha"]},
                       operation="delete_file")
@@ -1,12 +1,14 @@
 import asyncio
 from typing import Any
 
-import boto3
 from botocore.exceptions import BotoCoreError, ClientError
 
 
-def _make_s3_client(cfg: dict[str, Any]) -> boto3.client:
+def _make_s3_client(cfg: dict[str, Any]):
     """Create a boto3 S3 client using the supplied configuration."""
+    # boto3 costs ~200ms to import; pay it on first use, not at extension load.
+    import boto3
+
     session_kwargs = {
         "aws_access_key_id": cfg.get("access_key"),
         "aws_secret_access_key": cfg.get("secret_key"),
@@ -28,6 +30,17 @@ def register(api):
         "region", required=False, description="AWS region (e.g., us-east-1)", secret=False
     )
 
+    # boto3 builds a session, loads service models from disk and opens a new
+    # connection pool per client; reuse one until the credentials change.
+    state: dict[str, Any] = {"client": None, "key": None}
+
+    def _client(cfg: dict[str, Any]):
+        key = (cfg.get("access_key"), cfg.get("secret_key"), cfg.get("region"))
+        if state["client"] is None or state["key"] != key:
+            state["client"] = _make_s3_client(cfg)
+            state["key"] = key
+        return state["client"]
+
     # ----------------------------------------------------------------------
     # Helper to run blocking boto3 calls in a thread
     # ----------------------------------------------------------------------
@@ -50,7 +63,7 @@ def register(api):
     )
     async def list_buckets(args, ctx):
         cfg = api.config()
-        client = _make_s3_client(cfg)
+        client = _client(cfg)
 
         def _list():
             return client.list_buckets().get("Buckets", [])
@@ -80,7 +93,7 @@ def register(api):
         bucket = _resolve_bucket(args, cfg)
         if not bucket:
             return ctx.fail("No bucket specified and none configured")
-        client = _make_s3_client(cfg)
+        client = _client(cfg)
         prefix = args.get("prefix", "")
 
         def _list():
@@ -120,7 +133,7 @@ def register(api):
         bucket = _resolve_bucket(args, cfg)
         if not bucket:
             return ctx.fail("No bucket specified and none configured")
-        client = _make_s3_client(cfg)
+        client = _client(cfg)
         key = args["key"]
 
         def _get():
@@ -156,7 +169,7 @@ def register(api):
         bucket = _resolve_bucket(args, cfg)
         if not bucket:
             return ctx.fail("No bucket specified and none configured")
-        client = _make_s3_client(cfg)
+        client = _client(cfg)
         key = args["key"]
         content = args["content"]
 
@@ -187,7 +200,7 @@ def register(api):
         bucket = _resolve_bucket(args, cfg)
         if not bucket:
             return ctx.fail("No bucket specified and none configured")
-        client = _make_s3_client(cfg)
+        client = _client(cfg)
         key = args["key"]
 
         def _delete():
@@ -216,7 +229,7 @@ def register(api):
         bucket = _resolve_bucket(args, cfg)
         if not bucket:
             return ctx.fail("No bucket specified and none configured")
-        client = _make_s3_client(cfg)
+        client = _client(cfg)
 
         def _stats():
             paginator = client.get_paginator("list_objects_v2")
@@ -9,7 +9,9 @@ exactly like a connector op did.
 
 from __future__ import annotations
 
+import asyncio
 import re
+import threading
 import time
 from typing import Any
 
@@ -17,6 +19,12 @@ from dacli.connectors.base import ToolResult, ToolStatus
 from dacli.core.verify import result_succeeded
 
 
+# The query echoed back in result metadata: newlines to spaces, semicolons dropped,
+# whitespace runs collapsed — one translate + one C-level sub per result.
+_TRIM_TABLE = str.maketrans({"\n": " ", ";": None})
+_WS_RUN = re.compile(r"\s{2,}")
+
+
 # ---------------------------------------------------------------------------
 # Structured catalog-effect parsing (owned by the seed — SQL is its domain).
 # Drives the result's catalog_effects so a freshly mutated object stops being
@@ -80,8 +88,11 @@ def parse_catalog_effects(query: str) -> list[dict[str, Any]]:
 def register(api):
     cfg = api.config
     # Lazy, cached connection — keyed in the registration closure, not a module
-    # global, so a reload starts clean.
-    state: dict[str, Any] = {"cursor": None}
+    # global, so a reload starts clean. Cursors are per call: tools run on worker
+    # threads, and the connector lets threads share a connection (threadsafety
+    # 2) but not a cursor. The lock keeps concurrent first calls to one login.
+    state: dict[str, Any] = {"conn": None}
+    login = threading.Lock()
 
     api.config_field("account", required=True, description="Snowflake account identifier")
     api.config_field("user", required=True, description="Login user")
@@ -91,27 +102,31 @@ def register(api):
     api.config_field("database", description="Default database")
     api.config_field("schema", default="PUBLIC", description="Default schema")
 
-    def cursor():
-        if state["cursor"] is not None:
-            return state["cursor"]
+    def connection():
+        with login:
+            if state["conn"] is None:
+                state["conn"] = _connect(cfg())
+            return state["conn"]
+
+    def run(sql: str, params: tuple | None = None, *, one: bool = False):
+        """Execute *sql* and fetch on a fresh cursor — blocking, so call via to_thread.
+
+        ``params`` fill ``%s`` markers, bound by the connector (pyformat). Returns
+        ``(columns, rows, rowcount)``; ``columns``/``rows`` are None for a
+        statement with no result set. The first call also logs in.
+        """
+        cur = connection().cursor()
         try:
-            import snowflake.connector
-        except ImportError as e:
-            raise ConnectionError(
-                "The Snowflake SDK is not installed. Install it with: "
-                "pip install 'dacli[snowflake]'"
-            ) from e
-        c = cfg()
-        conn = snowflake.connector.connect(
-            account=c.get("account", ""), user=c.get("user", ""),
-            password=c.get("password", ""), role=c.get("role", ""),
-            warehouse=c.get("warehouse", ""), database=c.get("database", ""),
-            schema=c.get("schema", "PUBLIC"),
-            login_timeout=c.get("login_timeout", 60),
-            network_timeout=c.get("network_timeout", 60),
-        )
-        state["cursor"] = conn.cursor()
-        return state["cursor"]
+            if params is None:
+                cur.execute(sql)
+            else:
+                cur.execute(sql, params)
+            if not cur.description:
+                return None, None, cur.rowcount
+            columns = [d[0] for d in cur.description]
+            return columns, ([cur.fetchone()] if one else cur.fetchall()), cur.rowcount
+        finally:
+            cur.close()
 
     @api.tool(
         name="execute_snowflake_query",
@@ -126,20 +141,17 @@ def register(api):
         query = args.get("query", "")
         t0 = time.time()
         try:
-            cur = cursor()
-            cur.execute(query)
+            columns, rows, rowcount = await asyncio.to_thread(run, query)
             effects = parse_catalog_effects(query)
-            trimmed = query[:200].replace("\n", " ").replace("  ", " ").replace(";", "")
-            if cur.description:
-                rows = cur.fetchall()
-                columns = [d[0] for d in cur.description]
+            trimmed = _WS_RUN.sub(" ", query[:200].translate(_TRIM_TABLE))
+            if columns is not None:
                 results = [dict(zip(columns, row, strict=True)) for row in rows]
-                total = cur.rowcount if cur.rowcount >= 0 else len(results)
+                total = rowcount if rowcount >= 0 else len(results)
                 return ctx.ok(
                     results, query=trimmed, rows_returned=len(results),
                     total_rows=total, columns=columns, catalog_effects=effects,
                 )
-            rows_affected = cur.rowcount if cur.rowcount >= 0 else 0
+            rows_affected = rowcount if rowcount >= 0 else 0
             return ctx.ok(
                 None, query=trimmed, rows_affected=rows_affected, catalog_effects=effects,
             )
@@ -167,17 +179,19 @@ def register(api):
         obj = args.get("object")
         scope = {"database": database, "schema": schema, "object": obj}
         try:
-            cur = cursor()
+            # Names are bound, not spliced in: the statement text stays the same
+            # across objects and a quote in a name cannot break out. The database
+            # is an identifier, which cannot be a bind.
             if object_type == "schema":
                 sql = (f"SELECT SCHEMA_NAME FROM {database}.INFORMATION_SCHEMA.SCHEMATA "
-                       f"WHERE SCHEMA_NAME = '{(schema or '').upper()}'")
+                       "WHERE SCHEMA_NAME = %s")
+                params = ((schema or "").upper(),)
             else:
                 sql = (f"SELECT COLUMN_NAME, DATA_TYPE FROM {database}.INFORMATION_SCHEMA.COLUMNS "
-                       f"WHERE TABLE_SCHEMA = '{(schema or '').upper()}' "
-                       f"AND TABLE_NAME = '{(obj or '').upper()}' ORDER BY ORDINAL_POSITION")
-            cur.execute(sql)
-            columns = [d[0] for d in cur.description]
-            records = [dict(zip(columns, row, strict=True)) for row in cur.fetchall()]
+                       "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s ORDER BY ORDINAL_POSITION")
+                params = ((schema or "").upper(), (obj or "").upper())
+            columns, rows, _ = await asyncio.to_thread(run, sql, params)
+            records = [dict(zip(columns, row, strict=True)) for row in rows]
             exists = len(records) > 0
             cols = None
             if object_type != "schema" and exists:
@@ -202,17 +216,35 @@ def register(api):
     )
     async def validate_snowflake_connection(args, ctx):
         try:
-            cur = cursor()
-            cur.execute(
+            columns, rows, _ = await asyncio.to_thread(
+                run,
                 "SELECT CURRENT_WAREHOUSE() AS WAREHOUSE, CURRENT_DATABASE() AS DATABASE, "
-                "CURRENT_SCHEMA() AS SCHEMA, CURRENT_ROLE() AS ROLE, CURRENT_USER() AS USER;")
-            columns = [d[0] for d in cur.description]
-            context = dict(zip(columns, cur.fetchone(), strict=True))
+                "CURRENT_SCHEMA() AS SCHEMA, CURRENT_ROLE() AS ROLE, CURRENT_USER() AS USER;",
+                one=True)
+            context = dict(zip(columns, rows[0], strict=True))
             return ctx.ok(context, query="VALIDATE CONNECTION AND GET CONTEXT")
         except Exception as e:
             return _err(e, 0.0, {})
 
 
+def _connect(c: dict[str, Any]):
+    try:
+        import snowflake.connector
+    except ImportError as e:
+        raise ConnectionError(
+            "The Snowflake SDK is not installed. Install it with: "
+            "pip install 'dacli[snowflake]'"
+        ) from e
+    return snowflake.connector.connect(
+        account=c.get("account", ""), user=c.get("user", ""),
+        password=c.get("password", ""), role=c.get("role", ""),
+        warehouse=c.get("warehouse", ""), database=c.get("database", ""),
+        schema=c.get("schema", "PUBLIC"),
+        login_timeout=c.get("login_timeout", 60),
+        network_timeout=c.get("network_timeout", 60),
+    )
+
+
 def _err(exc: Exception, elapsed_s: float, metadata: dict[str, Any]) -> ToolResult:
     return ToolResult(
         tool_name="snowflake", status=ToolStatus.ERROR, data=None, error=str(exc),
@@ -51,6 +51,13 @@ def test_sample_tool_appears_in_definitions(tmp_path):
     assert reg.resolve("sample_list").spec.risk.value == "safe"
 
 
+def test_tool_counts_per_extension(tmp_path):
+    _write_ext(tmp_path, "sample", SAMPLE)
+    _write_ext(tmp_path, "other", SAMPLE.replace("sample_list", "other_list"))
+    reg = load_extensions(tmp_path)
+    assert reg.tool_counts() == {"sample": 1, "other": 1}
+
+
 def test_config_fields_recorded(tmp_path):
     _write_ext(tmp_path, "sample", SAMPLE)
     reg = load_extensions(tmp_path)
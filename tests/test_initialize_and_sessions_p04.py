@@ -107,6 +107,29 @@ class InitializeHonestyTest(unittest.TestCase):
              mock.patch.object(agent.registry, "get_catalog", return_value={}):
             self.assertFalse(asyncio.run(agent.initialize()))
 
+    def test_llm_and_connectors_connect_concurrently(self):
+        # Each side waits for the other to have started: a serial initialize()
+        # would block on the first wait and time out.
+        llm_started, conn_started = asyncio.Event(), asyncio.Event()
+
+        class _WaitingLLM:
+            async def initialize(self):
+                llm_started.set()
+                await asyncio.wait_for(conn_started.wait(), 1)
+
+        class _WaitingConnector:
+            name = "waiting"
+
+            async def connect(self):
+                conn_started.set()
+                await asyncio.wait_for(llm_started.wait(), 1)
+
+        agent = self._agent(_WaitingLLM())
+        with mock.patch.object(agent.registry, "enabled_connectors",
+                               return_value=[_WaitingConnector()]), \
+             mock.patch.object(agent.registry, "get_catalog", return_value={}):
+            self.assertTrue(asyncio.run(agent.initialize()))
+
 
 class ListSessionsTest(unittest.TestCase):
     """Acceptance: list_sessions drops the always-zero ``tables_created``."""
@@ -136,6 +159,55 @@ class ListSessionsTest(unittest.TestCase):
         self.assertEqual(session["active_task"], "load CRM")
         self.assertEqual(session["errors_count"], 0)
 
+    def test_limit_parses_only_the_most_recent_state_files(self):
+        memory = self._memory()
+        memory.set_todos([{"content": "current", "status": "in_progress"}])
+        state_dir = memory.state_path
+        for i, stamp in enumerate((1_000_000, 2_000_000)):
+            old = state_dir / f"state_old{i}.json"
+            old.write_text(
+                f'{{"session_id": "old{i}", "updated_at": "2000-01-0{i + 1}"}}',
+                encoding="utf-8",
+            )
+            os.utime(old, (stamp, stamp))
+        self.assertEqual(len(memory.list_sessions()), 3)
+        ids = [s["session_id"] for s in memory.list_sessions(limit=2)]
+        self.assertEqual(ids, [memory.session_id, "old1"])
+
+    def test_unchanged_state_files_are_not_reparsed(self):
+        memory = self._memory()
+        memory.set_todos([{"content": "first", "status": "in_progress"}])
+        memory.list_sessions()
+        with mock.patch("dacli.core.memory._json_loads") as load:
+            (session,) = memory.list_sessions()
+        load.assert_not_called()
+        self.assertEqual(session["active_task"], "first")
+        # A save rewrites the file, so the next listing sees the new state.
+        memory.set_todos([{"content": "second", "status": "in_progress"}])
+        (session,) = memory.list_sessions()
+        self.assertEqual(session["active_task"], "second")
+
+    def test_summary_cache_keeps_only_recently_listed_files(self):
+        from dacli.core import memory as memory_mod
+
+        memory = self._memory()
+        memory.set_todos([{"content": "current", "status": "in_progress"}])
+        for i in range(3):
+            (memory.state_path / f"state_old{i}.json").write_text(
+                f'{{"session_id": "old{i}", "updated_at": "2000-01-0{i + 1}"}}',
+                encoding="utf-8")
+        with mock.patch.object(memory_mod, "_SUMMARY_CACHE_SIZE", 2):
+            self.assertEqual(len(memory.list_sessions()), 4)
+            cached = [k for k in memory_mod._SUMMARY_CACHE if k.startswith(str(memory.state_path))]
+        self.assertEqual(len(cached), 2)
+
+    def test_recent_messages_is_the_tail(self):
+        memory = self._memory()
+        for i in range(5):
+            memory.add_user_message(f"m{i}")
+        self.assertEqual([m.content for m in memory.get_recent_messages(2)], ["m3", "m4"])
+        self.assertEqual(memory.get_recent_messages(0), [])
+
 
 class SessionsCommandTest(unittest.TestCase):
     """`dacli sessions` renders without error and without a Tables column."""
@@ -13,6 +13,9 @@ import json
 import shutil
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
 
 import dacli.eval.golden as _golden
 from dacli.connectors.dispatcher import Dispatcher
@@ -49,10 +52,11 @@ def _golden_result(case):
     return blob["results"][0]
 
 
-def _dispatcher(extension_id):
+def _dispatcher(extension_id, config=None):
     """The governed dispatcher M04 wires, with approval granted — no verifier, so
     the result shape matches the M01 fixtures (which carry no verification block)."""
-    reg = ExtensionDispatchRegistry(load_extensions(SEEDS))
+    provider = (lambda name: dict(config)) if config is not None else None
+    reg = ExtensionDispatchRegistry(load_extensions(SEEDS, config_provider=provider))
     perms = PermissionRegistry(default_scope=Scope.READ_ONLY)
     perms.grant(extension_id, Scope.ADMIN)
     gov = Governor(
@@ -85,6 +89,9 @@ class FakeCursor:
     def fetchone(self):
         return self._rows[0]
 
+    def close(self):
+        pass
+
 
 class FakeSnowflakeConn:
     def __init__(self, cursor):
@@ -95,9 +102,11 @@ class FakeSnowflakeConn:
 
 
 class _Resp:
-    def __init__(self, status, payload):
+    def __init__(self, status, payload, headers=None):
         self.status_code = status
         self._payload = payload
+        self.headers = headers or {}
+        self.content = json.dumps(payload).encode() if payload is not None else b""
 
     def json(self):
         return self._payload
@@ -111,7 +120,7 @@ class FakeHttpx:
     def __init__(self, resp):
         self._resp = resp
 
-    async def get(self, *a, **k):
+    async def request(self, *a, **k):
         return self._resp
 
 
@@ -134,6 +143,62 @@ def test_snowflake_read_matches_m01(monkeypatch):
     assert _scrub(dict(res.metadata)) == golden["metadata"]
 
 
+def test_snowflake_sdk_calls_run_off_the_event_loop(monkeypatch):
+    import threading
+
+    import snowflake.connector
+
+    threads = []
+
+    class _Cursor(FakeCursor):
+        def execute(self, sql):
+            threads.append(threading.current_thread())
+
+    cur = _Cursor(["N"], [(1,)])
+    monkeypatch.setattr(snowflake.connector, "connect",
+                        lambda **kw: FakeSnowflakeConn(cur), raising=False)
+
+    res = _dispatch("snowflake", "execute_snowflake_query", {"query": "SELECT 1 AS N"})
+
+    assert res.status is ToolStatus.SUCCESS
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_snowflake_concurrent_calls_share_one_login_not_a_cursor(monkeypatch):
+    import snowflake.connector
+
+    cursors, logins = [], []
+
+    class _Cursor(FakeCursor):
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    class _Conn:
+        def cursor(self):
+            cursors.append(_Cursor(["N"], [(1,)]))
+            return cursors[-1]
+
+    def _login(**kw):
+        logins.append(kw)
+        return _Conn()
+
+    monkeypatch.setattr(snowflake.connector, "connect", _login, raising=False)
+    dispatcher = _dispatcher("snowflake")
+
+    async def _fan_out():
+        return await asyncio.gather(*(
+            dispatcher.execute("execute_snowflake_query", {"query": "SELECT 1 AS N"})
+            for _ in range(4)))
+
+    results = asyncio.run(_fan_out())
+
+    assert all(r.status is ToolStatus.SUCCESS for r in results)
+    assert len(logins) == 1
+    assert len(cursors) == 4 and all(c.closed for c in cursors)
+
+
 def test_github_read_matches_m01(monkeypatch):
     import httpx
 
@@ -152,6 +217,368 @@ def test_github_read_matches_m01(monkeypatch):
     assert _scrub(dict(res.metadata)) == golden["metadata"]
 
 
+def test_github_read_revalidates_with_etag(monkeypatch):
+    import httpx
+
+    payload = {
+        "path": "dbt_project.yml",
+        "content": base64.b64encode(b"name: warehouse\n").decode(),
+        "sha": "feedface", "size": 16,
+    }
+    seen = []
+
+    class _Client:
+        async def request(self, method, url, headers=None):
+            seen.append(headers)
+            if headers:  # unchanged: 304, empty body
+                return _Resp(304, None)
+            return _Resp(200, payload, headers={"ETag": '"abc"'})
+
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kw: _Client())
+
+    dispatcher = _dispatcher("github")
+
+    async def _twice():
+        args = {"path": "dbt_project.yml"}
+        return [await dispatcher.execute("read_github_file", args) for _ in range(2)]
+
+    first, second = asyncio.run(_twice())
+    assert seen == [None, {"If-None-Match": '"abc"'}]
+    assert second.status is ToolStatus.SUCCESS
+    assert second.data["content"] == first.data["content"] == "name: warehouse\n"
+
+
+def test_github_etag_cache_is_bounded(monkeypatch):
+    # Large bodies are never cached; past the entry cap the oldest url is evicted.
+    import httpx
+
+    small = {"content": base64.b64encode(b"x").decode(), "sha": "s", "size": 1}
+    big = {"content": base64.b64encode(b"y" * 300_000).decode(), "sha": "b",
+           "size": 300_000}
+    seen = []
+
+    class _Client:
+        async def request(self, method, url, headers=None):
+            seen.append((url.rsplit("/", 1)[-1].split("?")[0], headers))
+            if headers:
+                return _Resp(304, None)
+            body = big if "big.bin" in url else small
+            return _Resp(200, dict(body, path=url), headers={"ETag": '"e"'})
+
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kw: _Client())
+    dispatcher = _dispatcher("github")
+
+    async def _read(*names):
+        for name in names:
+            res = await dispatcher.execute("read_github_file", {"path": name})
+            assert res.status is ToolStatus.SUCCESS
+
+    asyncio.run(_read("big.bin", "big.bin"))
+    assert seen == [("big.bin", None), ("big.bin", None)]
+
+    seen.clear()
+    asyncio.run(_read(*(f"f{i}.txt" for i in range(129)), "f1.txt", "f0.txt"))
+    assert seen[-2:] == [("f1.txt", {"If-None-Match": '"e"'}), ("f0.txt", None)]
+
+
+def test_github_client_is_pooled_and_released_on_shutdown(monkeypatch):
+    # A real AsyncClient, so the assertions see the pool httpx actually built.
+    import httpx
+    from importlib.util import find_spec
+
+    clients, closed = [], []
+
+    async def _request(self, method, url, **kw):
+        clients.append(self)
+        return _Resp(404, {})
+
+    async def _aclose(self):
+        closed.append(self)
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", _request)
+    monkeypatch.setattr(httpx.AsyncClient, "aclose", _aclose)
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.local:3128")
+    reg = load_extensions(SEEDS)
+    dispatcher = Dispatcher(ExtensionDispatchRegistry(reg), memory=None, governor=None)
+
+    async def _run():
+        await dispatcher.execute("read_github_file", {"path": "a"})
+        await dispatcher.execute("read_github_file", {"path": "b"})
+        for ext, handler in reg.handlers_for("session_shutdown"):
+            if ext == "github":
+                handler("reload")
+        await asyncio.sleep(0)
+
+    asyncio.run(_run())
+    client = clients[0]
+    assert all(c is client for c in clients)  # one client serves every call
+    pool = client._transport._pool
+    assert pool._keepalive_expiry == 60
+    assert pool._max_keepalive_connections == 20
+    assert pool._http2 is (find_spec("h2") is not None)
+    assert client._mounts  # the environment proxy is still honoured
+    assert closed == [client]
+
+
+def test_github_retries_a_failed_connect(monkeypatch):
+    import httpx
+
+    payload = {"path": "a", "content": base64.b64encode(b"x").decode(), "sha": "s", "size": 1}
+    attempts = []
+
+    class _Client:
+        async def request(self, method, url, headers=None):
+            attempts.append(method)
+            if len(attempts) == 1:
+                raise httpx.ConnectError("connection refused")
+            return _Resp(200, payload)
+
+    async def _sleep(delay):
+        pass
+
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kw: _Client())
+    monkeypatch.setattr(asyncio, "sleep", _sleep)
+
+    res = _dispatch("github", "read_github_file", {"path": "a"})
+
+    assert res.status is ToolStatus.SUCCESS
+    assert attempts == ["GET", "GET"]
+
+
+def test_github_push_sends_a_preencoded_json_body(monkeypatch):
+    import httpx
+
+    sent = {}
+
+    class _Client(FakeHttpx):
+        async def request(self, method, url, content=None, headers=None):
+            if method == "GET":
+                return _Resp(404, {})
+            sent.update(content=content, headers=headers)
+            return _Resp(201, {"content": {"path": "a.sql", "sha": "s1"},
+                               "commit": {"sha": "c1", "message": "add"}})
+
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kw: _Client(_Resp(404, {})))
+
+    res = _dispatch("github", "push_github_file",
+                    {"path": "a.sql", "content": "select 1", "message": "add"})
+
+    assert res.status is ToolStatus.SUCCESS
+    assert res.data["action"] == "created"
+    assert isinstance(sent["content"], bytes)
+    assert sent["headers"] == {"Content-Type": "application/json"}
+    body = json.loads(sent["content"])
+    assert base64.b64decode(body["content"]) == b"select 1"
+
+
+def test_github_tree_lists_a_subtree_in_one_request(monkeypatch):
+    import httpx
+
+    tree = {"truncated": False, "tree": [
+        {"path": "models", "type": "tree"},
+        {"path": "models/staging", "type": "tree"},
+        {"path": "models/staging/stg_users.sql", "type": "blob", "size": 42},
+        {"path": "README.md", "type": "blob", "size": 7},
+    ]}
+    urls = []
+
+    class _Client:
+        async def request(self, method, url, headers=None):
+            urls.append(url)
+            return _Resp(200, tree)
+
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kw: _Client())
+
+    res = _dispatch("github", "list_github_tree", {"path": "models/"})
+
+    assert res.status is ToolStatus.SUCCESS
+    assert len(urls) == 1 and urls[0].endswith("/git/trees/main?recursive=1")
+    assert res.data["entries"] == [
+        {"name": "staging", "type": "dir", "path": "models/staging", "size": 0},
+        {"name": "stg_users.sql", "type": "file", "path": "models/staging/stg_users.sql", "size": 42},
+    ]
+
+
+def test_github_escapes_the_branch_in_urls(monkeypatch):
+    import httpx
+
+    urls = []
+
+    class _Client:
+        async def request(self, method, url, headers=None):
+            urls.append(url)
+            return _Resp(200, {"truncated": False, "tree": []} if "/git/trees/" in url
+                         else {"content": "", "sha": "s", "size": 0})
+
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kw: _Client())
+    dispatcher = _dispatcher("github", {"branch": "fix/50% off #2?"})
+
+    async def _run():
+        for tool, args in [("list_github_tree", {}), ("read_github_file", {"path": "a b.sql"})]:
+            res = await dispatcher.execute(tool, args)
+            assert res.status is ToolStatus.SUCCESS, res.error
+
+    asyncio.run(_run())
+    assert urls[0].endswith("/git/trees/fix/50%25%20off%20%232%3F?recursive=1")
+    assert urls[1].endswith("/contents/a%20b.sql?ref=fix/50%25%20off%20%232%3F")
+
+
+def test_github_push_files_lands_one_commit(monkeypatch):
+    import httpx
+
+    calls = []
+
+    class _Client:
+        async def request(self, method, url, content=None, headers=None):
+            calls.append((method, url))
+            if "/git/ref/heads/" in url:
+                return _Resp(200, {"object": {"sha": "p1"}})
+            if method == "GET":
+                return _Resp(200, {"tree": {"sha": "t0"}})
+            body = json.loads(content)
+            if url.endswith("/git/trees"):
+                assert body["base_tree"] == "t0" and len(body["tree"]) == 3
+                return _Resp(201, {"sha": "t1"})
+            if url.endswith("/git/commits"):
+                assert body["parents"] == ["p1"] and body["tree"] == "t1"
+                return _Resp(201, {"sha": "c1", "message": body["message"]})
+            return _Resp(200, {"object": {"sha": body["sha"]}})
+
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kw: _Client())
+
+    files = [{"path": f"models/m{i}.sql", "content": f"select {i}", "mode": "100644"}
+             for i in range(3)]
+    res = _dispatch("github", "push_github_files", {"files": files, "message": "add models"})
+
+    assert res.status is ToolStatus.SUCCESS
+    assert res.data["commit_sha"] == "c1"
+    assert [m for m, _ in calls] == ["GET", "GET", "POST", "POST", "PATCH"]
+    assert calls[-1][1].endswith("/git/refs/heads/main")
+
+
+def test_github_push_files_keeps_modes_and_validates(monkeypatch):
+    import httpx
+
+    trees, calls = [], []
+
+    class _Client:
+        async def request(self, method, url, content=None, headers=None):
+            calls.append(url)
+            if "/git/ref/heads/" in url:
+                return _Resp(200, {"object": {"sha": "p1"}})
+            if "/git/trees/t0" in url:  # the base tree, read for inherited modes
+                return _Resp(200, {"tree": [
+                    {"path": "bin/run.sh", "mode": "100755", "type": "blob"},
+                    {"path": "README.md", "mode": "100644", "type": "blob"},
+                ]})
+            if method == "GET":
+                return _Resp(200, {"tree": {"sha": "t0"}})
+            body = json.loads(content)
+            if url.endswith("/git/trees"):
+                trees.append(body["tree"])
+                return _Resp(201, {"sha": "t1"})
+            if url.endswith("/git/commits"):
+                return _Resp(201, {"sha": "c1", "message": body["message"]})
+            return _Resp(200, {"object": {"sha": body["sha"]}})
+
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kw: _Client())
+
+    files = [{"path": "bin/run.sh", "content": "#!/bin/sh\n"},
+             {"path": "bin/new.sh", "content": "#!/bin/sh\n", "mode": "100755"},
+             {"path": "notes.txt", "content": "hi"}]
+    res = _dispatch("github", "push_github_files", {"files": files, "message": "m"})
+
+    assert res.status is ToolStatus.SUCCESS
+    assert [(e["path"], e["mode"]) for e in trees[0]] == [
+        ("bin/run.sh", "100755"), ("bin/new.sh", "100755"), ("notes.txt", "100644")]
+
+    calls.clear()
+    for bad, why in [([{"path": "a.sql"}], "files[0] needs a string 'path' and 'content'"),
+                     ([{"path": "a", "content": "", "mode": "120000"}], "files[0] mode must be")]:
+        res = _dispatch("github", "push_github_files", {"files": bad, "message": "m"})
+        assert res.status is not ToolStatus.SUCCESS and why in res.error
+    assert calls == []
+
+
+def test_github_calls_wait_out_a_spent_rate_limit(monkeypatch):
+    import httpx
+
+    sleeps = []
+
+    async def _sleep(delay):
+        sleeps.append(delay)
+
+    reset = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"}
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kw: FakeHttpx(_Resp(404, {}, headers=reset)))
+    monkeypatch.setattr("time.time", lambda: 1000.0)
+    monkeypatch.setattr(asyncio, "sleep", _sleep)
+
+    dispatcher = _dispatcher("github")
+
+    async def _twice():
+        for path in ("a", "b"):
+            await dispatcher.execute("read_github_file", {"path": path})
+
+    asyncio.run(_twice())
+    # The first call learns the budget is spent; the second waits for the reset.
+    assert sleeps == [30.0]
+
+
+def test_github_reset_wait_does_not_hold_an_in_flight_slot(monkeypatch):
+    import httpx
+
+    real_sleep, real_semaphore = asyncio.sleep, asyncio.Semaphore
+    now = [1000.0]
+    reset = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"}
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kw: FakeHttpx(_Resp(404, {}, headers=reset)))
+    monkeypatch.setattr("time.time", lambda: now[0])
+    # One in-flight slot, so a parked call that kept it would stall everyone else.
+    monkeypatch.setattr(asyncio, "Semaphore", lambda n: real_semaphore(1))
+    dispatcher = _dispatcher("github")
+    monkeypatch.setattr(asyncio, "Semaphore", real_semaphore)
+
+    async def _run():
+        released = asyncio.Event()
+
+        async def _sleep(delay):
+            await released.wait()
+
+        monkeypatch.setattr(asyncio, "sleep", _sleep)
+        await dispatcher.execute("read_github_file", {"path": "a"})  # spends the budget
+        parked = asyncio.create_task(dispatcher.execute("read_github_file", {"path": "b"}))
+        await real_sleep(0.01)  # b is now waiting for the reset
+        now[0] = 1031.0
+        await asyncio.wait_for(dispatcher.execute("read_github_file", {"path": "c"}), 1)
+        released.set()
+        await parked
+
+    asyncio.run(_run())
+
+
+def test_github_retries_throttled_and_unavailable_reads(monkeypatch):
+    import httpx
+
+    payload = {"path": "a", "content": base64.b64encode(b"x").decode(), "sha": "s", "size": 1}
+    answers = [_Resp(503, None), _Resp(429, None, headers={"Retry-After": "7"}),
+               _Resp(200, payload)]
+    sleeps = []
+
+    class _Client:
+        async def request(self, method, url, headers=None):
+            return answers.pop(0)
+
+    async def _sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kw: _Client())
+    monkeypatch.setattr(asyncio, "sleep", _sleep)
+
+    res = _dispatch("github", "read_github_file", {"path": "a"})
+
+    assert res.status is ToolStatus.SUCCESS
+    assert len(sleeps) == 2 and 1 <= sleeps[0] < 2 and sleeps[1] == 7.0
+
+
 def test_shell_command_matches_m01():
     from dacli.context.sources.terminal import ScrollbackStore
     from dacli.eval.sim.shell import make_sim_session
@@ -193,5 +620,75 @@ def test_empty_overlay_falls_through_to_seeds(monkeypatch, tmp_path):
     assert sorted(load_extensions().extension_ids()) == ["aws_lambda", "dynamodb", "github", "s3", "shell", "snowflake"]
 
 
+def test_loading_seeds_defers_the_boto3_import():
+    # Extension load runs on every startup; boto3 is paid only on first AWS call.
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from dacli.core import paths\n"
+        "from dacli.core.extensions import load_extensions\n"
+        "load_extensions(paths.bundled_seeds_dir('extensions'))\n"
+        "print('boto3' in sys.modules)\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+class _FakeBoto:
+    """Stands in for boto3's client factories; every client call returns empty."""
+
+    def __init__(self):
+        self.built = []
+
+    def client(self, service, **kw):
+        self.built.append((service, kw))
+        return self
+
+    def session(self, **kw):
+        return SimpleNamespace(client=lambda service: self.client(service, **kw))
+
+    def list_buckets(self):
+        return {"Buckets": []}
+
+    def scan(self, **kw):
+        return {"Items": []}
+
+    def get_paginator(self, op):
+        return SimpleNamespace(paginate=lambda: [{"Functions": []}])
+
+
+@pytest.mark.parametrize("extension_id, tool", [
+    ("s3", "list_buckets"), ("dynamodb", "dynamodb_scan"), ("aws_lambda", "list_functions"),
+])
+def test_aws_seed_reuses_its_client_until_credentials_change(monkeypatch, extension_id, tool):
+    import boto3
+
+    fake = _FakeBoto()
+    monkeypatch.setattr(boto3, "client", fake.client)
+    monkeypatch.setattr(boto3.session, "Session", fake.session)
+
+    config = {"access_key": "AKIA1", "secret_key": "s1", "region": "us-east-1", "table": "t"}
+    dispatcher = _dispatcher(extension_id, config)
+
+    async def _call():
+        res = await dispatcher.execute(tool, {})
+        assert res.status is ToolStatus.SUCCESS, res.error
+
+    async def _calls():
+        await _call()
+        await _call()
+        assert len(fake.built) == 1  # same credentials: the cached client
+        config["region"] = "eu-west-1"
+        await _call()
+        config["secret_key"] = "s2"
+        await _call()
+        await _call()
+
+    asyncio.run(_calls())
+    assert len(fake.built) == 3
+
+
 def test_seeds_carry_no_manifest():
     assert list(SEEDS.glob("*/manifest.yaml")) == []
@@ -78,16 +78,21 @@ def test_host_exposes_the_slash_surface():
 def test_safe_seed_tool_dispatches_through_the_host(monkeypatch):
     import snowflake.connector
 
+    executed = []
+
     class _Cur:
         description = [("COLUMN_NAME",), ("DATA_TYPE",)]
         rowcount = 1
 
-        def execute(self, sql):
-            self._sql = sql
+        def execute(self, sql, params=None):
+            executed.append((sql, params))
 
         def fetchall(self):
             return [("id", "NUMBER")]
 
+        def close(self):
+            pass
+
     class _Conn:
         def cursor(self):
             return _Cur()
@@ -104,3 +109,6 @@ def test_safe_seed_tool_dispatches_through_the_host(monkeypatch):
         ))
         assert res.status is ToolStatus.SUCCESS
         assert res.data["exists"] is True
+        # Object names travel as binds, never spliced into the statement.
+        (sql, params), = executed
+        assert params == ("S", "T") and "'S'" not in sql
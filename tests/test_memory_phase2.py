@@ -212,6 +212,18 @@ class RetrievalTest(unittest.TestCase):
         e = MemoryEntry(content="bronze crm", superseded_by="other")
         self.assertEqual(retrieve("bronze crm", [e]), [])
 
+    def test_entry_tokens_are_cached_across_retrievals(self):
+        from dacli.memory.retrieval import _tokens
+
+        entries = [MemoryEntry(content=f"bronze crm table t{i}") for i in range(5)]
+        retrieve("bronze crm", entries)
+        before = _tokens.cache_info()
+        retrieve("crm table", entries)
+        after = _tokens.cache_info()
+        # Only the new query string is tokenized; every entry's content is a hit.
+        self.assertEqual(after.misses - before.misses, 1)
+        self.assertGreaterEqual(after.hits - before.hits, len(entries))
+
 
 # ---------------------------------------------------------------------------
 # Exit criterion: verify() re-checks against a (mock) live system and updates
@@ -44,6 +44,50 @@ class FastJsonTest(unittest.TestCase):
         s = dumps({"price": Decimal("1.5")}, default=str)
         self.assertEqual(json.loads(s), {"price": "1.5"})
 
+    def test_indent_and_loads_round_trip(self):
+        from dacli.core.fastjson import dumps, dumps_bytes, loads
+
+        obj = {"todos": [{"content": "é", "status": "pending"}], 1: "int key"}
+        text = dumps(obj, indent=True)
+        self.assertIn('\n  "todos"', text)
+        self.assertEqual(loads(dumps_bytes(obj, indent=True)), json.loads(text))
+        self.assertEqual(loads(text)["1"], "int key")
+
+    def test_ints_wider_than_64_bits_round_trip_exactly(self):
+        from dacli.core.fastjson import dumps, dumps_bytes, loads
+
+        # orjson refuses to encode these and decodes them as floats; a Snowflake
+        # NUMBER(38,0) column produces them, so both directions must fall back.
+        obj = {"rows": [{"ID": 2**70, "NEG": -(2**70)}], "ok": 1}
+        self.assertEqual(loads(dumps_bytes(obj, default=str)), obj)
+        self.assertEqual(loads(dumps(obj, indent=True)), obj)
+        self.assertIsInstance(loads(dumps(obj))["rows"][0]["ID"], int)
+
+    def test_int64_boundaries_decode_exactly_from_str_and_bytes(self):
+        from dacli.core.fastjson import dumps, loads
+
+        for n in (-(2**63), -(2**63) - 1, 2**63 - 1, 2**64):
+            with self.subTest(n=n):
+                text = dumps({"a": n})
+                for doc in (text, text.encode("utf-8"), str(n), str(n).encode("utf-8")):
+                    value = loads(doc)
+                    value = value["a"] if isinstance(value, dict) else value
+                    self.assertIsInstance(value, int)
+                    self.assertEqual(value, n)
+
+    def test_session_state_keeps_a_wide_int_result(self):
+        from dacli.core.memory import AgentMemory
+
+        with TemporaryDirectory() as root:
+            memory = AgentMemory(state_path=f"{root}/state", history_path=f"{root}/history",
+                                 memory_path=f"{root}/memory")
+            memory.log_tool_execution("execute_snowflake_query", {"query": "SELECT ID"},
+                                      result=[{"ID": 2**70}])
+            reloaded = AgentMemory(state_path=f"{root}/state", history_path=f"{root}/history",
+                                   memory_path=f"{root}/memory")
+            self.assertTrue(reloaded.load_session(memory.session_id))
+            self.assertEqual(reloaded.get_tool_history()[0].result, [{"ID": 2**70}])
+
     def test_orjson_is_used_when_available(self):
         # orjson is in the environment for this repo; the flag must reflect that.
         import dacli.core.fastjson as fj
@@ -232,5 +232,54 @@ class ToolbarCostTest(unittest.TestCase):
         self.assertEqual(self._store().session_cost_usd("nope"), 0.0)
 
 
+class HttpConnectorClientTest(unittest.TestCase):
+    """HttpConnector keeps one httpx client per event loop and closes it on disconnect."""
+
+    def _connector(self):
+        from dacli.connectors.http_base import HttpConnector
+
+        class _Api(HttpConnector):
+            name = "api"
+
+            def _base_url(self):
+                return "https://api.example"
+
+            def operations(self):
+                return []
+
+            async def invoke(self, op, args):
+                return self._unknown_op(op)
+
+        return _Api(settings=None)
+
+    def test_client_is_reused_and_closed_on_disconnect(self):
+        conn = self._connector()
+
+        async def _run():
+            first = conn._http()
+            self.assertIs(conn._http(), first)
+            with mock.patch.object(first, "aclose", mock.AsyncMock()) as aclose:
+                await conn.disconnect()
+            aclose.assert_awaited_once()
+            self.assertIsNone(conn._client)
+            self.assertIsNot(conn._http(), first)  # next use builds a fresh pool
+            await conn.disconnect()
+
+        asyncio.run(_run())
+
+    def test_client_from_an_earlier_loop_is_replaced(self):
+        # CLI commands each call asyncio.run; the old loop's client is unusable.
+        conn = self._connector()
+
+        async def _grab():
+            return conn._http()
+
+        first = asyncio.run(_grab())
+        second = asyncio.run(_grab())
+        self.assertIsNot(second, first)
+        asyncio.run(conn.disconnect())  # a stale-loop client is dropped, not awaited
+        self.assertIsNone(conn._client)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -143,3 +143,18 @@ def test_status_panel_renders_on_ui(tmp_path):
     assert "Plan" in out
     assert "Statistics" in out
     assert "load data" in out
+
+
+def test_status_panel_is_a_single_print(tmp_path):
+    mem = _memory(tmp_path)
+    mem.set_todos([{"content": "load data", "status": "pending"}])
+    mem.state.last_error = "boom [not markup]"
+    console = Console(record=True, width=100, force_terminal=False)
+    ui = DacliUI(version="9.9.9", author="tester", console=console)
+    calls = []
+    real_print = console.print
+    console.print = lambda *a, **k: (calls.append(a), real_print(*a, **k))
+    ui.status_panel(mem)
+    assert len(calls) == 1
+    out = console.export_text()
+    assert "Last error: boom [not markup]" in out
@@ -65,6 +65,20 @@ class SettingsConstructibleTest(unittest.TestCase):
         self.assertEqual(ConnectorConfig(settings, "pinecone").get("api_key", ""), "")
 
 
+class SaveConfigTest(unittest.TestCase):
+    def test_save_config_round_trips(self):
+        from dacli.config.settings import save_config
+
+        root = tempfile.mkdtemp(prefix="dacli_save_cfg_")
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        path = os.path.join(root, "config.yaml")
+        settings = Settings(llm={"model": "m", "api_key": "k"})
+        save_config(settings, path)
+        self.assertNotIn("!!python", Path(path).read_text(encoding="utf-8"))
+        invalidate_config_cache()
+        self.assertEqual(load_config(path).model_dump(), settings.model_dump())
+
+
 class IsLlmConfiguredTest(unittest.TestCase):
     def _settings(self, **llm):
         return Settings(llm=llm)
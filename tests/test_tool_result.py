@@ -9,7 +9,7 @@
 import json
 import unittest
 
-from dacli.connectors.base import ToolResult, ToolStatus
+from dacli.connectors.base import OperationSpec, ToolResult, ToolStatus
 
 
 class ToolStatusValueTest(unittest.TestCase):
@@ -35,6 +35,82 @@ class ToolResultToDictTest(unittest.TestCase):
         self.assertEqual(payload["status"], "error")
         self.assertNotIn("ToolStatus", json.dumps(payload))
 
+    def test_to_json_bytes_matches_to_dict(self):
+        from decimal import Decimal
+
+        result = ToolResult(tool_name="t", status=ToolStatus.SUCCESS,
+                            data=[{"price": Decimal("1.5")}])
+        payload = json.loads(result.to_json_bytes())
+        self.assertEqual(payload["status"], "success")
+        self.assertEqual(payload["data"], [{"price": "1.5"}])
+        self.assertEqual(payload["timestamp"], result.to_dict()["timestamp"])
+
+    def test_timestamp_is_derived_from_epoch_ns(self):
+        from datetime import datetime
+
+        before = datetime.now()
+        result = ToolResult(tool_name="t", status=ToolStatus.SUCCESS)
+        self.assertIsInstance(result.timestamp_ns, int)
+        self.assertLessEqual(abs((result.timestamp - before).total_seconds()), 5)
+        self.assertEqual(datetime.fromisoformat(result.to_dict()["timestamp"]), result.timestamp)
+
+
+class ToolResultMessageTest(unittest.TestCase):
+    def test_rows_are_numbered_from_one_and_never_capped(self):
+        rows = [{"id": i} for i in range(25)]
+        msg = ToolResult(tool_name="q", status=ToolStatus.SUCCESS, data=rows).to_message()
+        lines = msg.splitlines()
+        self.assertEqual(lines[0], "[q] Executed successfully. Returned 25 rows:")
+        self.assertEqual(lines[1], " Row 1: {'id': 0}")
+        self.assertEqual(lines[-1], " Row 25: {'id': 24}")
+
+    def test_scalar_and_empty_payloads(self):
+        ok = ToolStatus.SUCCESS
+        self.assertEqual(ToolResult("q", ok, data=[]).to_message(),
+                         "[q] Executed successfully. No results returned")
+        self.assertEqual(ToolResult("q", ok, data=["a", "b"]).to_message(),
+                         "[q] Executed successfully. Returned 2 rows:\n['a', 'b']")
+        self.assertEqual(ToolResult("q", ok, data={"k": 1}).to_message(),
+                         "[q] Executed successfully:\n{'k': 1}")
+
+
+class ToolResultLayoutTest(unittest.TestCase):
+    def test_slotted_instances_reject_stray_attributes(self):
+        result = ToolResult(tool_name="t", status=ToolStatus.SUCCESS)
+        self.assertFalse(hasattr(result, "__dict__"))
+        # frozen+slots rejects with TypeError on 3.10/3.11 (bpo-45897).
+        with self.assertRaises((AttributeError, TypeError)):
+            result.extra = 1
+
+    def test_frozen_results_are_annotated_by_copy(self):
+        from dataclasses import FrozenInstanceError
+
+        result = ToolResult(tool_name="t", status=ToolStatus.SUCCESS, metadata={"a": 1})
+        with self.assertRaises(FrozenInstanceError):
+            result.metadata = {}
+        tagged = result.with_metadata(tier="safe")
+        self.assertEqual(tagged.metadata, {"a": 1, "tier": "safe"})
+        self.assertEqual(result.metadata, {"a": 1})
+        self.assertEqual(tagged.timestamp_ns, result.timestamp_ns)
+
+
+class ToolDefinitionTest(unittest.TestCase):
+    def test_definition_is_rendered_once_per_spec(self):
+        spec = OperationSpec(name="op", description="d", parameters={"type": "object"},
+                             capability="x.read")
+        first = spec.to_tool_definition()
+        self.assertIs(spec.to_tool_definition(), first)
+        self.assertEqual(first["function"]["name"], "op")
+        self.assertNotIn("_tool_definition", repr(spec))
+
+    def test_system_connector_reuses_its_specs(self):
+        from dacli.connectors.system.connector import SystemConnector
+
+        conn = SystemConnector()
+        a, b = conn.operations(), conn.operations()
+        self.assertIsNot(a, b)  # callers get their own list …
+        self.assertTrue(all(x is y for x, y in zip(a, b, strict=True)))  # … of shared specs
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,6 +8,7 @@ These cover the two pieces most likely to break silently:
 """
 
 import asyncio
+import io
 import types
 
 from rich.console import Console
@@ -58,6 +59,32 @@ def test_transcript_primitives_render():
     assert "done" in out
 
 
+def test_tool_start_sql_plain_when_highlighting_off(monkeypatch):
+    from dacli.config.settings import Settings
+    from dacli.tui import transcript
+
+    settings = Settings()
+    settings.ui.syntax_highlighting = False
+    console = Console(record=True, width=80, force_terminal=False)
+    ui = DacliUI(settings=settings, version="9.9.9", author="tester", console=console)
+    monkeypatch.setattr(transcript, "Syntax", None)  # must not be reached
+    ui.tool_start("execute_query", {"query": "SELECT 1"})
+    assert "SELECT 1" in console.export_text()
+
+
+def test_piped_output_skips_highlighting(monkeypatch):
+    from rich.highlighter import NullHighlighter
+
+    from dacli.tui import transcript
+
+    ui = _recording_ui()  # force_terminal=False: what a pipe looks like
+    monkeypatch.setattr(transcript, "Syntax", None)  # must not be reached
+    ui.tool_start("execute_query", {"query": "SELECT 1"})
+    assert "SELECT 1" in ui.console.export_text()
+    monkeypatch.setattr("sys.stdout", io.StringIO())
+    assert isinstance(DacliUI().console.highlighter, NullHighlighter)
+
+
 def test_stream_view_leaves_final_markdown():
     ui = _recording_ui()
     ui.on_stream_start()
@@ -77,6 +104,15 @@ def test_set_theme_known_and_unknown():
     assert ui.set_theme("bogus") is False
 
 
+def test_rich_theme_and_icon_maps_are_built_once():
+    spec = get_theme("nord")
+    assert spec.rich_theme() is spec.rich_theme()
+    ui = _recording_ui()
+    assert ui.glyphs.notice_icons is ui.glyphs.notice_icons
+    assert ui._notice_icon("bad") == ui.glyphs.err
+    assert ui.glyphs.todo_icons["in_progress"] == ui.glyphs.running
+
+
 def test_every_theme_toolbar_colors_are_prompt_toolkit_parseable():
     # Regression: prompt-toolkit parses the bar colors on every redraw and
     # raises on Rich-only names like "grey15" — which crashes the input loop.
@@ -298,6 +334,19 @@ def test_tool_end_health_error_hints_debug_connector():
     assert "/debug-connector" in out
 
 
+def test_turn_end_is_a_single_write():
+    ui = _recording_ui()
+    calls = []
+    real_print = ui.console.print
+    ui.console.print = lambda *a, **k: (calls.append(a), real_print(*a, **k))
+    ui.turn_end(error="failed to decrypt secrets store", needs_input=True)
+    assert len(calls) == 1
+    out = ui.console.export_text()
+    assert "Error: failed to decrypt secrets store" in out
+    assert "/connect" in out
+    assert "waiting for your input" in out
+
+
 def test_error_decryption_failure_hints_connect():
     ui = _recording_ui()
     ui.error("failed to decrypt secrets store")
@@ -406,3 +455,19 @@ def test_stream_openai_tolerates_bad_json_arguments():
     content, tool_calls = asyncio.run(client._stream_openai({"model": "x", "messages": []}, on_text=None))
     assert content == ""
     assert tool_calls == [{"id": "c1", "name": "f", "arguments": {}}]
+
+
+def test_bounded_file_history_loads_only_the_newest_entries(tmp_path, monkeypatch):
+    from prompt_toolkit.history import FileHistory
+
+    from dacli.tui.chat_session import _BoundedFileHistory
+
+    path = str(tmp_path / "input_history.txt")
+    full = FileHistory(path)
+    for i in range(50):
+        full.store_string(f"select {i}\nfrom t" if i % 7 == 0 else f"msg {i}")
+    monkeypatch.setattr(_BoundedFileHistory, "_BLOCK", 64)  # force partial reads
+    got = list(_BoundedFileHistory(path, 5).load_history_strings())
+    assert got == list(full.load_history_strings())[:5]
+    assert got[0] == "select 49\nfrom t"
+    assert list(_BoundedFileHistory(str(tmp_path / "missing"), 5).load_history_strings()) == []